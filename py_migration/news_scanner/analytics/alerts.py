@@ -4,48 +4,62 @@ Alert Detection
 Detects high-priority alert keywords in news text.
 """
 
+import sys
 from typing import Optional
 from dataclasses import dataclass
 
+from .matcher import KeywordMatcher
 
-@dataclass
+
+# Severity levels (interned so comparisons against them are identity checks)
+SEV_CRITICAL = sys.intern("critical")
+SEV_HIGH = sys.intern("high")
+SEV_ELEVATED = sys.intern("elevated")
+SEV_NORMAL = sys.intern("normal")
+
+
+@dataclass(frozen=True)
 class AlertResult:
     """Result of alert detection."""
     is_alert: bool
     keyword: Optional[str] = None
-    severity: str = "normal"  # "normal", "elevated", "high", "critical"
+    severity: str = SEV_NORMAL  # "normal", "elevated", "high", "critical"
+
+
+# Shared result for the common no-match case (AlertResult is immutable)
+_NO_ALERT = AlertResult(is_alert=False)
 
 
 # Default alert keywords with severity levels
 DEFAULT_ALERT_KEYWORDS: dict[str, str] = {
     # Critical
-    "nuclear": "critical",
-    "assassination": "critical",
-    "coup": "critical",
-    "martial law": "critical",
-    "war declared": "critical",
+    "nuclear": SEV_CRITICAL,
+    "assassination": SEV_CRITICAL,
+    "coup": SEV_CRITICAL,
+    "martial law": SEV_CRITICAL,
+    "war declared": SEV_CRITICAL,
 
     # High
-    "war": "high",
-    "invasion": "high",
-    "missile": "high",
-    "bomb": "high",
-    "terrorist": "high",
-    "hostage": "high",
-    "casualties": "high",
+    "war": SEV_HIGH,
+    "invasion": SEV_HIGH,
+    "missile": SEV_HIGH,
+    "bomb": SEV_HIGH,
+    "terrorist": SEV_HIGH,
+    "hostage": SEV_HIGH,
+    "casualties": SEV_HIGH,
 
     # Elevated
-    "military": "elevated",
-    "sanctions": "elevated",
-    "attack": "elevated",
-    "troops": "elevated",
-    "conflict": "elevated",
-    "strike": "elevated",
-    "ceasefire": "elevated",
-    "treaty": "elevated",
-    "nato": "elevated",
-    "emergency": "elevated",
-    "evacuation": "elevated",
+    "military": SEV_ELEVATED,
+    "sanctions": SEV_ELEVATED,
+    "attack": SEV_ELEVATED,
+    "troops": SEV_ELEVATED,
+    "conflict": SEV_ELEVATED,
+    "strike": SEV_ELEVATED,
+    "ceasefire": SEV_ELEVATED,
+    "treaty": SEV_ELEVATED,
+    "nato": SEV_ELEVATED,
+    "emergency": SEV_ELEVATED,
+    "evacuation": SEV_ELEVATED,
 }
 
 
@@ -79,42 +93,59 @@ class AlertDetector:
         """
         self.keywords = keywords if keywords is not None else DEFAULT_ALERT_KEYWORDS.copy()
         self.case_sensitive = case_sensitive
+        self._rebuild()
 
+    def _rebuild(self):
+        """Re-sort keywords and rebuild the matching automaton."""
         # Sort by severity (critical first) for priority matching
-        severity_order = {"critical": 0, "high": 1, "elevated": 2, "normal": 3}
-        self._sorted_keywords = sorted(
-            self.keywords.items(),
-            key=lambda x: severity_order.get(x[1], 3)
+        severity_order = {SEV_CRITICAL: 0, SEV_HIGH: 1, SEV_ELEVATED: 2, SEV_NORMAL: 3}
+        # Immutable (search_key, keyword, severity) entries, computed once per
+        # keyword change rather than per detect call
+        self._sorted_keywords = tuple(
+            (keyword if self.case_sensitive else keyword.lower(), keyword, severity)
+            for keyword, severity in sorted(
+                self.keywords.items(),
+                key=lambda x: severity_order.get(x[1], 3)
+            )
+        )
+
+        # Matcher payload is the keyword's priority rank (index in sorted order)
+        self._matcher = KeywordMatcher(
+            (search_key, rank)
+            for rank, (search_key, _, _) in enumerate(self._sorted_keywords)
         )
 
-    def detect(self, text: str) -> AlertResult:
+    def detect(self, text: str, text_lower: Optional[str] = None) -> AlertResult:
         """
         Detect alert keywords in text.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             AlertResult with is_alert, keyword, and severity.
         """
         if not text:
-            return AlertResult(is_alert=False)
+            return _NO_ALERT
 
-        search_text = text if self.case_sensitive else text.lower()
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
 
-        for keyword, severity in self._sorted_keywords:
-            kw = keyword if self.case_sensitive else keyword.lower()
-            if kw in search_text:
-                return AlertResult(is_alert=True, keyword=keyword, severity=severity)
+        # Highest-priority match wins
+        rank = min(self._matcher.iter(search_text), default=None)
+        if rank is None:
+            return _NO_ALERT
 
-        return AlertResult(is_alert=False)
+        _, keyword, severity = self._sorted_keywords[rank]
+        return AlertResult(is_alert=True, keyword=keyword, severity=severity)
 
-    def detect_all(self, text: str) -> list[AlertResult]:
+    def detect_all(self, text: str, text_lower: Optional[str] = None) -> list[AlertResult]:
         """
         Detect all alert keywords in text.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             List of AlertResults for all matches.
@@ -122,30 +153,24 @@ class AlertDetector:
         if not text:
             return []
 
-        search_text = text if self.case_sensitive else text.lower()
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
         results = []
 
-        for keyword, severity in self._sorted_keywords:
-            kw = keyword if self.case_sensitive else keyword.lower()
-            if kw in search_text:
-                results.append(AlertResult(is_alert=True, keyword=keyword, severity=severity))
+        for rank in sorted(set(self._matcher.iter(search_text))):
+            _, keyword, severity = self._sorted_keywords[rank]
+            results.append(AlertResult(is_alert=True, keyword=keyword, severity=severity))
 
         return results
 
-    def add_keyword(self, keyword: str, severity: str = "elevated"):
+    def add_keyword(self, keyword: str, severity: str = SEV_ELEVATED):
         """Add a new alert keyword."""
-        self.keywords[keyword] = severity
-        # Re-sort
-        severity_order = {"critical": 0, "high": 1, "elevated": 2, "normal": 3}
-        self._sorted_keywords = sorted(
-            self.keywords.items(),
-            key=lambda x: severity_order.get(x[1], 3)
-        )
+        self.keywords[keyword] = sys.intern(severity)
+        self._rebuild()
 
     def remove_keyword(self, keyword: str):
         """Remove an alert keyword."""
         self.keywords.pop(keyword, None)
-        self._sorted_keywords = [(k, v) for k, v in self._sorted_keywords if k != keyword]
+        self._rebuild()
 
     def get_keywords(self) -> dict[str, str]:
         """Get all keywords with their severities."""
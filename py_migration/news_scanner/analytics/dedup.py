@@ -5,13 +5,79 @@ Removes duplicate news items based on ID and title similarity.
 """
 
 import re
-import hashlib
-from typing import Optional
+import string
+import sys
+from datetime import datetime, timedelta
+from functools import lru_cache
+from heapq import heappop, heappush
+from typing import Iterable, Iterator, Optional
 from dataclasses import dataclass
 
 from ..models import NormalizedNewsItem
 
 
+# ASCII bytes dropped when normalizing titles (everything except [a-z0-9])
+_TITLE_DROP_BYTES = bytes(
+    c for c in range(128)
+    if chr(c) not in string.ascii_lowercase + string.digits
+)
+
+# URL normalization: protocol + www. prefix, and leading tracking params
+_URL_PREFIX_RE = re.compile(r'^(?:https?://)?(?:www\.)?')
+_URL_TRACKING_RE = re.compile(r'\?(?:utm_[^&]+|ref=[^&]+)(?:&|$)')
+
+# Title tokenization: runs of word characters
+_WORD_RE = re.compile(r'\w+')
+
+# Normalization results are cached per raw string so titles/URLs seen again
+# in later batches (e.g. by SlidingWindowDeduplicator) are not reprocessed.
+_CACHE_SIZE = 16_384
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_title_hash(title: str) -> str:
+    """Lowercase title with everything except [a-z0-9] removed."""
+    if not title:
+        return ""
+
+    # Encoding to ASCII drops non-ASCII characters, translate drops the
+    # rest in one C pass.
+    normalized = title.lower().encode('ascii', 'ignore')
+    return normalized.translate(None, _TITLE_DROP_BYTES).decode('ascii')
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_url(url: str) -> str:
+    """Lowercase URL without protocol, www., trailing slash or tracking params."""
+    if not url:
+        return ""
+
+    # Remove protocol and www.
+    url = _URL_PREFIX_RE.sub('', url, count=1)
+    # Remove trailing slash
+    url = url.rstrip('/')
+    # Remove common tracking params (utm_*, ref) in one pass
+    url = _URL_TRACKING_RE.sub('', url)
+
+    return url.lower()
+
+
+if sys.version_info >= (3, 11):
+    def _parse_timestamp(published_at: str) -> float:
+        """POSIX timestamp of an ISO 8601 date (3.11+ accepts a 'Z' suffix)."""
+        return datetime.fromisoformat(published_at).timestamp()
+else:
+    def _parse_timestamp(published_at: str) -> float:
+        """POSIX timestamp of an ISO 8601 date."""
+        return datetime.fromisoformat(published_at.replace('Z', '+00:00')).timestamp()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _title_tokens(title: str) -> frozenset[str]:
+    """Lowercased word set of a title."""
+    return frozenset(_WORD_RE.findall(title.lower()))
+
+
 @dataclass
 class DeduplicationResult:
     """Result of deduplication."""
@@ -72,8 +138,33 @@ class Deduplicator:
         if not items:
             return DeduplicationResult(items=[], removed_count=0, removed_ids=[])
 
-        unique = []
-        removed_ids = []
+        removed_ids: list[str] = []
+        unique = list(self.deduplicate_iter(items, removed_ids))
+
+        return DeduplicationResult(
+            items=unique,
+            removed_count=len(removed_ids),
+            removed_ids=removed_ids,
+        )
+
+    def deduplicate_iter(
+        self,
+        items: Iterable[NormalizedNewsItem],
+        removed_ids: Optional[list[str]] = None,
+    ) -> Iterator[NormalizedNewsItem]:
+        """
+        Lazily yield unique items in input order.
+
+        Only the seen-key sets are retained, so large or streamed batches
+        can be piped to storage without materializing the result list.
+
+        Args:
+            items: Iterable of news items.
+            removed_ids: Optional list that collects IDs of dropped items.
+
+        Yields:
+            Unique news items.
+        """
         seen_ids = set()
         seen_title_hashes = set()
         seen_urls = set()
@@ -81,14 +172,16 @@ class Deduplicator:
         for item in items:
             # Check ID
             if item.id in seen_ids:
-                removed_ids.append(item.id)
+                if removed_ids is not None:
+                    removed_ids.append(item.id)
                 continue
 
             # Check title hash
             if self.use_title_hash:
                 title_hash = self._normalize_title_hash(item.title)
                 if title_hash in seen_title_hashes:
-                    removed_ids.append(item.id)
+                    if removed_ids is not None:
+                        removed_ids.append(item.id)
                     continue
                 seen_title_hashes.add(title_hash)
 
@@ -96,18 +189,13 @@ class Deduplicator:
             if self.use_url and item.url:
                 normalized_url = self._normalize_url(item.url)
                 if normalized_url in seen_urls:
-                    removed_ids.append(item.id)
+                    if removed_ids is not None:
+                        removed_ids.append(item.id)
                     continue
                 seen_urls.add(normalized_url)
 
             seen_ids.add(item.id)
-            unique.append(item)
-
-        return DeduplicationResult(
-            items=unique,
-            removed_count=len(removed_ids),
-            removed_ids=removed_ids,
-        )
+            yield item
 
     def are_duplicates(self, item1: NormalizedNewsItem, item2: NormalizedNewsItem) -> bool:
         """
@@ -137,40 +225,33 @@ class Deduplicator:
                 return True
 
         # Fuzzy title match (if threshold < 1)
-        if self.title_similarity_threshold < 1.0:
-            similarity = self._title_similarity(item1.title, item2.title)
-            if similarity >= self.title_similarity_threshold:
-                return True
+        threshold = self.title_similarity_threshold
+        if threshold < 1.0:
+            # Overlap can't exceed the smaller/larger word count ratio; skip
+            # the set intersection when that bound already misses the threshold.
+            small, large = sorted((
+                len(_title_tokens(item1.title or "")),
+                len(_title_tokens(item2.title or "")),
+            ))
+            if small >= threshold * large:
+                similarity = self._title_similarity(item1.title, item2.title)
+                if similarity >= threshold:
+                    return True
 
         return False
 
     def _normalize_title_hash(self, title: str) -> str:
-        """Create a hash of normalized title for comparison."""
-        if not title:
-            return ""
-
-        # Normalize: lowercase, remove non-alphanumeric
-        normalized = re.sub(r'[^a-z0-9]', '', title.lower())
+        """
+        Create a comparison key from a normalized title.
 
-        # Hash it
-        return hashlib.md5(normalized.encode()).hexdigest()
+        The normalized string itself is the key (it is hashed by the set
+        it is stored in), so no digest is computed.
+        """
+        return _normalize_title_hash(title)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison."""
-        if not url:
-            return ""
-
-        # Remove protocol
-        url = re.sub(r'^https?://', '', url)
-        # Remove www.
-        url = re.sub(r'^www\.', '', url)
-        # Remove trailing slash
-        url = url.rstrip('/')
-        # Remove common tracking params
-        url = re.sub(r'\?utm_[^&]+(&|$)', '', url)
-        url = re.sub(r'\?ref=[^&]+(&|$)', '', url)
-
-        return url.lower()
+        return _normalize_url(url)
 
     def _title_similarity(self, title1: str, title2: str) -> float:
         """
@@ -181,16 +262,14 @@ class Deduplicator:
         if not title1 or not title2:
             return 0.0
 
-        words1 = set(re.findall(r'\w+', title1.lower()))
-        words2 = set(re.findall(r'\w+', title2.lower()))
+        words1 = _title_tokens(title1)
+        words2 = _title_tokens(title2)
 
         if not words1 or not words2:
             return 0.0
 
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union)
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
 
 
 class SlidingWindowDeduplicator(Deduplicator):
@@ -216,6 +295,7 @@ class SlidingWindowDeduplicator(Deduplicator):
         super().__init__(**kwargs)
         self.window_hours = window_hours
         self._seen_cache: dict[str, float] = {}  # id -> timestamp
+        self._seen_heap: list[tuple[float, str]] = []  # (timestamp, id), oldest first
 
     def deduplicate(self, items: list[NormalizedNewsItem]) -> DeduplicationResult:
         """
@@ -223,16 +303,16 @@ class SlidingWindowDeduplicator(Deduplicator):
 
         Items older than window_hours are removed from cache.
         """
-        from datetime import datetime, timedelta
-
         cutoff = datetime.utcnow() - timedelta(hours=self.window_hours)
         cutoff_ts = cutoff.timestamp()
 
-        # Clean old entries from cache
-        self._seen_cache = {
-            k: v for k, v in self._seen_cache.items()
-            if v > cutoff_ts
-        }
+        # Clean old entries from cache; only expired heap entries are touched.
+        # Stale heap entries (id re-seen with a newer timestamp) are skipped.
+        heap = self._seen_heap
+        while heap and heap[0][0] <= cutoff_ts:
+            ts, item_id = heappop(heap)
+            if self._seen_cache.get(item_id) == ts:
+                del self._seen_cache[item_id]
 
         # Use parent deduplication
         result = super().deduplicate(items)
@@ -240,8 +320,9 @@ class SlidingWindowDeduplicator(Deduplicator):
         # Add new items to cache
         for item in result.items:
             try:
-                ts = datetime.fromisoformat(item.published_at.replace('Z', '+00:00')).timestamp()
+                ts = _parse_timestamp(item.published_at)
                 self._seen_cache[item.id] = ts
+                heappush(self._seen_heap, (ts, item.id))
             except (ValueError, AttributeError):
                 pass
 
@@ -0,0 +1,156 @@
+"""
+Keyword Matching
+
+Multi-keyword substring search shared by the keyword-based analyzers.
+"""
+
+import re
+from collections import deque
+from typing import Any, Iterable, Iterator
+
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency: pyahocorasick
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Finds every keyword occurring in a text in a single pass.
+
+    Builds an Aho-Corasick automaton once, so scanning costs O(len(text))
+    regardless of how many keywords are registered. Uses the pyahocorasick
+    C extension when installed, otherwise a pure-Python automaton.
+
+    Matching is plain substring search (same semantics as `keyword in text`);
+    callers are responsible for lowercasing both sides when needed.
+
+    Example usage:
+        matcher = KeywordMatcher([("war", "high"), ("war declared", "critical")])
+        hits = list(matcher.iter("war declared"))
+        # Returns: ["high", "critical"]
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, Any]]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: (keyword, value) pairs. A keyword may be given several
+                times; every value is reported when it matches.
+        """
+        values: dict[str, list] = {}
+        for keyword, value in keywords:
+            if keyword:
+                values.setdefault(keyword, []).append(value)
+
+        self._words = {kw: tuple(v) for kw, v in values.items()}
+
+        if not self._words:
+            self._scan = _scan_nothing
+        elif ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for kw, payload in self._words.items():
+                automaton.add_word(kw, payload)
+            automaton.make_automaton()
+            self._scan = _automaton_scanner(automaton)
+        else:
+            self._scan = _prefiltered_scanner(_PyAutomaton(self._words), self._words)
+
+    def iter(self, text: str) -> Iterator[Any]:
+        """
+        Yield the value of every keyword occurrence in text.
+
+        A keyword occurring several times is reported several times.
+        """
+        return self._scan(text)
+
+    def matches(self, text: str) -> bool:
+        """Whether any keyword occurs in text (stops at the first hit)."""
+        for _ in self._scan(text):
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+
+def _scan_nothing(text: str) -> Iterator[Any]:
+    return iter(())
+
+
+def _automaton_scanner(automaton):
+    """Adapt a pyahocorasick automaton to the matcher scan interface."""
+    def scan(text: str) -> Iterator[Any]:
+        for _, payload in automaton.iter(text):
+            yield from payload
+    return scan
+
+
+def _prefiltered_scanner(automaton: "_PyAutomaton", words: dict[str, tuple]):
+    """
+    Skip the pure-Python automaton walk up to the first keyword occurrence.
+
+    A single alternation regex finds the leftmost occurrence in C. Texts with
+    no keyword (the common case) never enter the Python loop, and no match
+    can start before that position, so scanning resumes from there. The
+    regex alone is not enough since alternation misses overlapping keywords
+    ("war declared" hides "war").
+    """
+    prefilter = re.compile(
+        '|'.join(re.escape(kw) for kw in sorted(words, key=len, reverse=True))
+    )
+
+    def scan(text: str) -> Iterator[Any]:
+        match = prefilter.search(text)
+        if match is None:
+            return iter(())
+        return automaton.scan(text[match.start():])
+    return scan
+
+
+class _PyAutomaton:
+    """Pure-Python Aho-Corasick automaton (goto/fail/output tables)."""
+
+    def __init__(self, words: dict[str, tuple]):
+        goto: list[dict[str, int]] = [{}]
+        output: list[tuple] = [()]
+
+        for word, payload in words.items():
+            node = 0
+            for ch in word:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    output.append(())
+                node = nxt
+            output[node] = payload
+
+        # Breadth-first pass to compute failure links and merge outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                output[child] = output[child] + output[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def scan(self, text: str) -> Iterator[Any]:
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                yield from output[node]
@@ -4,8 +4,11 @@ Region Detection
 Detects geographic regions mentioned in news text.
 """
 
+from array import array
 from typing import Optional
 
+from .matcher import KeywordMatcher
+
 
 # Default region keywords
 DEFAULT_REGIONS: dict[str, list[str]] = {
@@ -77,7 +80,44 @@ class RegionDetector:
         self.regions = regions if regions is not None else DEFAULT_REGIONS.copy()
         self.case_sensitive = case_sensitive
 
-    def detect(self, text: str) -> Optional[str]:
+        # Built lazily on first scan, invalidated when regions change.
+        # Keywords of all regions are flattened into parallel tables indexed
+        # by position (region definition order, then keyword order).
+        self._matcher: Optional[KeywordMatcher] = None
+        self._region_names: list[str] = []
+        self._keywords: tuple[str, ...] = ()
+        self._region_of: array = array('H')
+
+    def _build(self):
+        """Flatten region keywords and build the matcher over them."""
+        self._region_names = list(self.regions)
+        flat = [
+            (keyword, r)
+            for r, keywords in enumerate(self.regions.values())
+            for keyword in keywords
+        ]
+        self._keywords = tuple(keyword for keyword, _ in flat)
+        self._region_of = array('H', (r for _, r in flat))
+        self._matcher = KeywordMatcher(
+            (keyword if self.case_sensitive else keyword.lower(), i)
+            for i, keyword in enumerate(self._keywords)
+        )
+
+    def _scan(self, text: str, text_lower: Optional[str] = None) -> list[int]:
+        """
+        Find all region keywords in text in a single pass.
+
+        Returns:
+            Sorted, unique flat keyword indices, i.e. in region definition
+            order and keyword order within a region.
+        """
+        if self._matcher is None:
+            self._build()
+
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
+        return sorted(set(self._matcher.iter(search_text)))
+
+    def detect(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Detect the primary region mentioned in text.
 
@@ -85,6 +125,7 @@ class RegionDetector:
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             Region name or None if no region detected.
@@ -92,22 +133,16 @@ class RegionDetector:
         if not text:
             return None
 
-        search_text = text if self.case_sensitive else text.lower()
-
-        for region, keywords in self.regions.items():
-            for keyword in keywords:
-                kw = keyword if self.case_sensitive else keyword.lower()
-                if kw in search_text:
-                    return region
+        hits = self._scan(text, text_lower)
+        return self._region_names[self._region_of[hits[0]]] if hits else None
 
-        return None
-
-    def detect_all(self, text: str) -> list[str]:
+    def detect_all(self, text: str, text_lower: Optional[str] = None) -> list[str]:
         """
         Detect all regions mentioned in text.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             List of region names.
@@ -115,24 +150,31 @@ class RegionDetector:
         if not text:
             return []
 
-        search_text = text if self.case_sensitive else text.lower()
-        detected = []
+        if self._matcher is None:
+            self._build()
+
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
+        region_of = self._region_of
 
-        for region, keywords in self.regions.items():
-            for keyword in keywords:
-                kw = keyword if self.case_sensitive else keyword.lower()
-                if kw in search_text:
-                    detected.append(region)
-                    break
+        # One bit per region; no sorting or per-hit list work
+        mask = 0
+        for i in self._matcher.iter(search_text):
+            mask |= 1 << region_of[i]
 
-        return detected
+        return [
+            name for r, name in enumerate(self._region_names)
+            if mask >> r & 1
+        ]
 
-    def detect_with_keywords(self, text: str) -> dict[str, list[str]]:
+    def detect_with_keywords(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> dict[str, list[str]]:
         """
         Detect regions and return the matching keywords.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             Dict of region -> list of matched keywords.
@@ -140,32 +182,29 @@ class RegionDetector:
         if not text:
             return {}
 
-        search_text = text if self.case_sensitive else text.lower()
-        results = {}
+        results: dict[str, list[str]] = {}
 
-        for region, keywords in self.regions.items():
-            matches = []
-            for keyword in keywords:
-                kw = keyword if self.case_sensitive else keyword.lower()
-                if kw in search_text:
-                    matches.append(keyword)
-            if matches:
-                results[region] = matches
+        for i in self._scan(text, text_lower):
+            region = self._region_names[self._region_of[i]]
+            results.setdefault(region, []).append(self._keywords[i])
 
         return results
 
     def add_region(self, name: str, keywords: list[str]):
         """Add a new region."""
         self.regions[name] = keywords
+        self._matcher = None
 
     def remove_region(self, name: str):
         """Remove a region."""
         self.regions.pop(name, None)
+        self._matcher = None
 
     def add_keyword(self, region: str, keyword: str):
         """Add a keyword to an existing region."""
         if region in self.regions:
             self.regions[region].append(keyword)
+            self._matcher = None
 
     def get_regions(self) -> list[str]:
         """Get list of all region names."""
@@ -9,6 +9,8 @@ from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .matcher import KeywordMatcher
+
 
 class Sentiment(str, Enum):
     """Sentiment categories."""
@@ -91,12 +93,26 @@ class SentimentAnalyzer:
         self.negative = negative if negative is not None else NEGATIVE_KEYWORDS.copy()
         self.case_sensitive = case_sensitive
 
-    def analyze(self, text: str) -> SentimentResult:
+        # Built lazily on first scan, invalidated when keywords change
+        self._matcher: Optional[KeywordMatcher] = None
+
+    def _get_matcher(self) -> KeywordMatcher:
+        """Get the polarity-tagged matcher, building it if needed."""
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(
+                (kw if self.case_sensitive else kw.lower(), (polarity, i))
+                for polarity, keywords in ((1, self.positive), (-1, self.negative))
+                for i, kw in enumerate(keywords)
+            )
+        return self._matcher
+
+    def analyze(self, text: str, text_lower: Optional[str] = None) -> SentimentResult:
         """
         Analyze sentiment of text.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             SentimentResult with sentiment, score, and matched keywords.
@@ -110,20 +126,16 @@ class SentimentAnalyzer:
                 negative_keywords=[],
             )
 
-        search_text = text if self.case_sensitive else text.lower()
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
 
-        # Find matches
+        # Find matches (single pass for both polarities)
         pos_matches = []
-        for kw in self.positive:
-            k = kw if self.case_sensitive else kw.lower()
-            if k in search_text:
-                pos_matches.append(kw)
-
         neg_matches = []
-        for kw in self.negative:
-            k = kw if self.case_sensitive else kw.lower()
-            if k in search_text:
-                neg_matches.append(kw)
+        for polarity, i in sorted(set(self._get_matcher().iter(search_text))):
+            if polarity > 0:
+                pos_matches.append(self.positive[i])
+            else:
+                neg_matches.append(self.negative[i])
 
         # Calculate score
         pos_count = len(pos_matches)
@@ -176,7 +188,9 @@ class SentimentAnalyzer:
     def add_positive(self, keyword: str):
         """Add a positive keyword."""
         self.positive.append(keyword)
+        self._matcher = None
 
     def add_negative(self, keyword: str):
         """Add a negative keyword."""
         self.negative.append(keyword)
+        self._matcher = None
@@ -5,7 +5,8 @@ Extracts stock symbols and cryptocurrency tickers from text.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import AbstractSet, Optional
 from dataclasses import dataclass
 
 
@@ -18,26 +19,47 @@ class TickerMatch:
 
 
 # Known crypto tickers (to avoid false positives)
-KNOWN_CRYPTO = {
+KNOWN_CRYPTO: frozenset[str] = frozenset({
     "BTC", "ETH", "SOL", "XRP", "ADA", "DOGE", "DOT", "AVAX",
     "MATIC", "LINK", "UNI", "ATOM", "LTC", "BCH", "XLM", "ALGO",
     "VET", "FIL", "THETA", "AAVE", "EOS", "XTZ", "MKR", "COMP",
-}
+})
 
 # Known indices
-KNOWN_INDICES = {
+KNOWN_INDICES: frozenset[str] = frozenset({
     "SPX", "DJI", "NDX", "RUT", "VIX", "DXY",
-}
+})
 
 # Common false positives to exclude
-EXCLUDED_WORDS = {
+EXCLUDED_WORDS: frozenset[str] = frozenset({
     "A", "I", "AM", "PM", "CEO", "CFO", "CTO", "COO", "AI", "US",
     "UK", "EU", "UN", "IT", "TV", "PC", "PR", "HR", "VP", "MD",
     "OF", "OR", "ON", "BY", "TO", "AT", "IS", "IN", "IF", "AS",
     "AN", "THE", "AND", "FOR", "NOT", "BUT", "NEW", "OLD", "TOP",
     "IPO", "CEO", "FDA", "SEC", "FBI", "CIA", "NSA", "DOJ", "EPA",
     "IRS", "GDP", "CPI", "PMI", "IMF", "WTO", "WHO",
-}
+})
+
+
+# Ticker styles that don't depend on the known symbols, compiled once.
+# Each style is scanned separately: as alternatives of one pattern they
+# would consume each other's text (in "$ETH Inc stock" the dollar style
+# would take "$ETH", leaving "Inc stock" to the stock style, which then
+# reports INC). Unicode matching is kept: re.ASCII would change \b next to
+# accented letters and which characters the stock style's IGNORECASE accepts.
+
+# $AAPL style
+_DOLLAR_RE = re.compile(r'\$([A-Z]{1,5})\b')
+# Explicit stock mentions: "AAPL stock", "shares of AAPL"
+_STOCK_RE = re.compile(r'\b([A-Z]{2,5})\s+(?:stock|shares|inc|corp|ltd)', re.IGNORECASE)
+# Parenthetical: "(AAPL)" often used for tickers
+_PAREN_RE = re.compile(r'\(([A-Z]{2,5})\)')
+
+
+@lru_cache(maxsize=64)
+def _crypto_pattern(symbols: frozenset[str]) -> re.Pattern:
+    """Known crypto symbols as words (compiled once per symbol set)."""
+    return re.compile(r'\b(' + '|'.join(map(re.escape, symbols)) + r')\b')
 
 
 class TickerExtractor:
@@ -59,33 +81,28 @@ class TickerExtractor:
 
     def __init__(
         self,
-        known_crypto: Optional[set[str]] = None,
-        known_indices: Optional[set[str]] = None,
-        excluded_words: Optional[set[str]] = None,
+        known_crypto: Optional[AbstractSet[str]] = None,
+        known_indices: Optional[AbstractSet[str]] = None,
+        excluded_words: Optional[AbstractSet[str]] = None,
     ):
         """
         Initialize ticker extractor.
 
+        The module-level frozenset defaults are shared by all instances;
+        add_crypto/add_excluded replace the instance's set instead of
+        mutating it, so neither the defaults nor caller-provided sets change.
+
         Args:
             known_crypto: Set of known crypto symbols.
             known_indices: Set of known index symbols.
             excluded_words: Words to exclude from matching.
         """
-        self.known_crypto = known_crypto if known_crypto is not None else KNOWN_CRYPTO.copy()
-        self.known_indices = known_indices if known_indices is not None else KNOWN_INDICES.copy()
-        self.excluded_words = excluded_words if excluded_words is not None else EXCLUDED_WORDS.copy()
+        self.known_crypto = known_crypto if known_crypto is not None else KNOWN_CRYPTO
+        self.known_indices = known_indices if known_indices is not None else KNOWN_INDICES
+        self.excluded_words = excluded_words if excluded_words is not None else EXCLUDED_WORDS
 
         # Compile regex patterns
-        self._patterns = [
-            # $AAPL style
-            (re.compile(r'\$([A-Z]{1,5})\b'), "stock"),
-            # Explicit stock mentions: "AAPL stock", "shares of AAPL"
-            (re.compile(r'\b([A-Z]{2,5})\s+(?:stock|shares|inc|corp|ltd)', re.IGNORECASE), "stock"),
-            # Crypto: known symbols as words
-            (re.compile(r'\b(' + '|'.join(self.known_crypto) + r')\b'), "crypto"),
-            # Parenthetical: "(AAPL)" often used for tickers
-            (re.compile(r'\(([A-Z]{2,5})\)'), "stock"),
-        ]
+        self._rebuild_patterns()
 
     def extract(self, text: str) -> list[str]:
         """
@@ -153,19 +170,20 @@ class TickerExtractor:
 
     def add_crypto(self, symbol: str):
         """Add a known crypto symbol."""
-        self.known_crypto.add(symbol.upper())
+        self.known_crypto = self.known_crypto | {symbol.upper()}
         self._rebuild_patterns()
 
     def add_excluded(self, word: str):
         """Add a word to exclude list."""
-        self.excluded_words.add(word.upper())
+        self.excluded_words = self.excluded_words | {word.upper()}
 
     def _rebuild_patterns(self):
         """Rebuild regex patterns after modifying known symbols."""
-        self._patterns[2] = (
-            re.compile(r'\b(' + '|'.join(self.known_crypto) + r')\b'),
-            "crypto"
-        )
+        self._patterns = [(_DOLLAR_RE, "stock"), (_STOCK_RE, "stock")]
+        if self.known_crypto:
+            # Crypto: known symbols as words
+            self._patterns.append((_crypto_pattern(frozenset(self.known_crypto)), "crypto"))
+        self._patterns.append((_PAREN_RE, "stock"))
 
     def is_ticker(self, symbol: str) -> bool:
         """Check if a symbol looks like a valid ticker."""
@@ -5,9 +5,12 @@ Detects topics from news text using keyword matching.
 Extensible - can add ML-based detection later.
 """
 
+from collections import Counter
 from typing import Optional
 from dataclasses import dataclass, field
 
+from .matcher import KeywordMatcher
+
 
 @dataclass
 class TopicConfig:
@@ -87,12 +90,28 @@ class TopicDetector:
         self.topics = topics if topics is not None else DEFAULT_TOPICS.copy()
         self.case_sensitive = case_sensitive
 
-    def detect(self, text: str) -> list[str]:
+        # Built lazily on first scan, invalidated when topics change
+        self._matcher: Optional[KeywordMatcher] = None
+        self._topic_names: list[str] = []
+
+    def _get_matcher(self) -> KeywordMatcher:
+        """Get the matcher over all topic keywords (payload: topic index)."""
+        if self._matcher is None:
+            self._topic_names = list(self.topics)
+            self._matcher = KeywordMatcher(
+                (keyword if self.case_sensitive else keyword.lower(), t)
+                for t, keywords in enumerate(self.topics.values())
+                for keyword in keywords
+            )
+        return self._matcher
+
+    def detect(self, text: str, text_lower: Optional[str] = None) -> list[str]:
         """
         Detect topics in text.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
             List of detected topic names.
@@ -100,51 +119,50 @@ class TopicDetector:
         if not text:
             return []
 
-        search_text = text if self.case_sensitive else text.lower()
-        detected = []
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
+        matcher = self._get_matcher()
 
-        for topic, keywords in self.topics.items():
-            for keyword in keywords:
-                kw = keyword if self.case_sensitive else keyword.lower()
-                if kw in search_text:
-                    detected.append(topic)
-                    break  # One match per topic is enough
+        # One bit per topic, reported in definition order
+        mask = 0
+        for t in matcher.iter(search_text):
+            mask |= 1 << t
 
-        return detected
+        return [
+            name for t, name in enumerate(self._topic_names)
+            if mask >> t & 1
+        ]
 
-    def detect_with_scores(self, text: str) -> dict[str, int]:
+    def detect_with_scores(self, text: str, text_lower: Optional[str] = None) -> dict[str, int]:
         """
         Detect topics with match counts.
 
         Args:
             text: Text to analyze.
+            text_lower: Precomputed text.lower(), if the caller has one.
 
         Returns:
-            Dict of topic -> match count.
+            Dict of topic -> match count (every keyword occurrence counts).
         """
         if not text:
             return {}
 
-        search_text = text if self.case_sensitive else text.lower()
-        scores = {}
-
-        for topic, keywords in self.topics.items():
-            count = 0
-            for keyword in keywords:
-                kw = keyword if self.case_sensitive else keyword.lower()
-                count += search_text.count(kw)
-            if count > 0:
-                scores[topic] = count
+        search_text = text if self.case_sensitive else (text_lower or text.lower())
+        counts = Counter(self._get_matcher().iter(search_text))
 
-        return scores
+        return {
+            name: counts[t] for t, name in enumerate(self._topic_names)
+            if counts[t]
+        }
 
     def add_topic(self, name: str, keywords: list[str]):
         """Add a new topic."""
         self.topics[name] = keywords
+        self._matcher = None
 
     def remove_topic(self, name: str):
         """Remove a topic."""
         self.topics.pop(name, None)
+        self._matcher = None
 
     def get_topics(self) -> list[str]:
         """Get list of all topic names."""
@@ -7,9 +7,11 @@ Each connector fetches data from an external source and returns normalized items
 from .gdelt import GdeltConnector
 from .rss import RSSConnector
 from .base import BaseConnector
+from .httpx_session import HttpxSession
 
 __all__ = [
     "BaseConnector",
     "GdeltConnector",
     "RSSConnector",
+    "HttpxSession",
 ]
@@ -2,10 +2,21 @@
 Base connector interface.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+import aiohttp
 
 from ..models import NormalizedNewsItem
+from ..utils import config
+from .httpx_session import HttpxSession
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# HTTP libraries a connector can create its session with
+TRANSPORTS = ("aiohttp", "httpx")
 
 
 class BaseConnector(ABC):
@@ -13,8 +24,20 @@ class BaseConnector(ABC):
     Abstract base class for news connectors.
 
     All connectors should implement this interface.
+
+    Connectors hold one HTTP session for all their fetches: either the
+    session passed to the constructor (owned by the caller) or one created
+    on first use, which close() releases.
     """
 
+    _session: Optional[aiohttp.ClientSession] = None
+    _owns_session: bool = True
+    transport: str = "aiohttp"
+
+    # Connection pool bounds for sessions created by the connector
+    connector_limit: int = 256
+    limit_per_host: int = 8
+
     @abstractmethod
     async def fetch(self, **kwargs) -> list[NormalizedNewsItem]:
         """
@@ -38,6 +61,79 @@ class BaseConnector(ABC):
         """
         pass
 
+    def _use_session(
+        self,
+        session: Optional[aiohttp.ClientSession],
+        transport: str = "aiohttp",
+    ) -> None:
+        """Adopt a caller-provided session (None: create one lazily with transport)."""
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport {transport!r}, expected one of {TRANSPORTS}")
+        self.transport = transport
+        self._session = session
+        self._owns_session = session is None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session shared by all fetches of this connector.
+
+        Reusing a session keeps connections (and TLS handshakes) alive
+        between requests to the same host.
+        """
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = self._create_session(self.timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session created by this connector (an injected one is left open)."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _create_session(self, timeout: float) -> aiohttp.ClientSession:
+        """
+        Create an HTTP session for the connector's transport.
+
+        The connection pool is bounded by the connector's connector_limit
+        (total) and limit_per_host; DNS answers are cached for 5 minutes.
+        The httpx transport only supports the total limit.
+        """
+        if self.transport == "httpx":
+            return HttpxSession(timeout, self.connector_limit)
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            ),
+        )
+
+    async def _gather_bounded(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        args: Iterable[T],
+    ) -> list[R]:
+        """
+        Run func over args concurrently, at most config.max_concurrent at once.
+
+        Returns:
+            Results in the order of args.
+        """
+        semaphore = asyncio.Semaphore(config.max_concurrent)
+
+        async def bounded(arg: T) -> R:
+            async with semaphore:
+                return await func(arg)
+
+        return await asyncio.gather(*(bounded(arg) for arg in args))
+
     def get_name(self) -> str:
         """Get connector name."""
         return self.__class__.__name__
@@ -13,9 +13,10 @@ import aiohttp
 
 from .base import BaseConnector
 from ..models import NormalizedNewsItem, NewsMetadata
-from ..utils import config, logger, generate_id, parse_gdelt_date, now_iso
+from ..utils import config, logger, generate_id, json_loads, parse_gdelt_date, now_iso
 from ..utils.config import GDELT_QUERIES
 from ..analytics import TopicDetector, AlertDetector
+from ..analytics.alerts import AlertResult
 
 
 class GdeltConnector(BaseConnector):
@@ -23,20 +24,20 @@ class GdeltConnector(BaseConnector):
     Connector for GDELT news API.
 
     Example usage:
-        connector = GdeltConnector()
-
-        # Fetch single category
-        items = await connector.fetch_category("finance")
-
-        # Fetch multiple categories
-        items = await connector.fetch(categories=["finance", "tech"])
-
-        # With options
-        items = await connector.fetch(
-            categories=["finance"],
-            max_records=50,
-            timespan="24h"
-        )
+        # The connector's session is closed when the block exits
+        async with GdeltConnector() as connector:
+            # Fetch single category
+            items = await connector.fetch_category("finance")
+
+            # Fetch multiple categories
+            items = await connector.fetch(categories=["finance", "tech"])
+
+            # With options
+            items = await connector.fetch(
+                categories=["finance"],
+                max_records=50,
+                timespan="24h"
+            )
     """
 
     def __init__(
@@ -46,6 +47,11 @@ class GdeltConnector(BaseConnector):
         max_records: int = 20,
         timespan: str = "7d",
         language: str = "english",
+        keep_raw: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+        connector_limit: int = 256,
+        limit_per_host: int = 8,
+        transport: str = "aiohttp",
     ):
         """
         Initialize GDELT connector.
@@ -56,12 +62,23 @@ class GdeltConnector(BaseConnector):
             max_records: Max articles per request (max 250).
             timespan: Time range for articles (e.g., "7d", "24h").
             language: Language filter.
+            keep_raw: Keep the source payload in metadata.raw.
+            session: HTTP session to use for all requests (left open by
+                close()). One is created on first use if None.
+            connector_limit: Max open connections of the created session.
+            limit_per_host: Max open connections per host of the created session.
+            transport: HTTP library of the created session, "aiohttp" or
+                "httpx" (optional dependency; HTTP/2 with h2 installed).
         """
         self.base_url = base_url or config.gdelt_base_url
         self.timeout = timeout
         self.max_records = min(max_records, 250)
         self.timespan = timespan
         self.language = language
+        self.keep_raw = keep_raw
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
+        self._use_session(session, transport)
 
         # Analytics (modular)
         self.topic_detector = TopicDetector()
@@ -84,22 +101,20 @@ class GdeltConnector(BaseConnector):
         if categories is None:
             categories = list(GDELT_QUERIES.keys())
 
-        all_items = []
-
-        for i, category in enumerate(categories):
-            if i > 0:
-                await asyncio.sleep(config.delay_between_requests)
-
-            items = await self.fetch_category(category, **kwargs)
-            all_items.extend(items)
+        # Categories are fetched concurrently over the connector's session
+        results = await self._gather_bounded(
+            lambda category: self.fetch_category(category, **kwargs),
+            categories,
+        )
 
-        return all_items
+        return [item for items in results for item in items]
 
     async def fetch_category(
         self,
         category: str,
         max_records: Optional[int] = None,
         timespan: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
         **kwargs
     ) -> list[NormalizedNewsItem]:
         """
@@ -109,6 +124,7 @@ class GdeltConnector(BaseConnector):
             category: News category.
             max_records: Override default max records.
             timespan: Override default timespan.
+            session: HTTP session. Defaults to the connector's session.
 
         Returns:
             List of normalized news items.
@@ -118,6 +134,9 @@ class GdeltConnector(BaseConnector):
             logger.warning(f"Unknown GDELT category: {category}")
             return []
 
+        if session is None:
+            session = self._get_session()
+
         # Build query
         full_query = f"{query} sourcelang:{self.language}"
         params = {
@@ -130,29 +149,32 @@ class GdeltConnector(BaseConnector):
         }
 
         url = f"{self.base_url}/api/v2/doc/doc?{urlencode(params)}"
-        logger.debug(f"Fetching GDELT {category}: {url}")
+        logger.debug("Fetching GDELT %s: %s", category, url)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        logger.warning(f"GDELT {category}: HTTP {response.status}")
-                        return []
+            async with session.get(url, timeout=self.timeout) as response:
+                if response.status != 200:
+                    logger.warning(f"GDELT {category}: HTTP {response.status}")
+                    return []
 
-                    content_type = response.headers.get('content-type', '')
-                    if 'json' not in content_type:
-                        logger.warning(f"GDELT {category}: Non-JSON response")
-                        return []
+                content_type = response.headers.get('content-type', '')
+                if 'json' not in content_type:
+                    logger.warning(f"GDELT {category}: Non-JSON response")
+                    return []
 
-                    data = await response.json()
+                body = await response.read()
 
-            articles = data.get("articles", [])
-            logger.info(f"GDELT {category}: {len(articles)} articles")
+            # GDELT repeats titles across results; analyze each title once
+            analytics: dict[str, tuple[list[str], AlertResult]] = {}
+            fetched_at = now_iso()
 
-            return [
-                self._transform_article(article, category)
-                for article in articles
+            items = [
+                self._transform_article(article, category, analytics, fetched_at)
+                for article in json_loads(body).get("articles", [])
             ]
+            logger.info(f"GDELT {category}: {len(items)} articles")
+
+            return items
 
         except asyncio.TimeoutError:
             logger.error(f"GDELT {category}: Timeout")
@@ -164,14 +186,38 @@ class GdeltConnector(BaseConnector):
             logger.error(f"GDELT {category}: {e}")
             return []
 
-    def _transform_article(self, article: dict, category: str) -> NormalizedNewsItem:
-        """Transform GDELT article to normalized schema."""
+    def _transform_article(
+        self,
+        article: dict,
+        category: str,
+        analytics: Optional[dict[str, tuple[list[str], AlertResult]]] = None,
+        fetched_at: Optional[str] = None,
+    ) -> NormalizedNewsItem:
+        """
+        Transform GDELT article to normalized schema.
+
+        Args:
+            article: Raw GDELT article.
+            category: News category.
+            analytics: Optional title -> (topics, alert) memo shared across
+                the articles of one response.
+            fetched_at: Fetch timestamp shared by the response. Defaults to now.
+        """
         title = article.get("title", "")
         url = article.get("url", "")
 
-        # Use modular analytics
-        topics = self.topic_detector.detect(title)
-        alert = self.alert_detector.detect(title)
+        cached = analytics.get(title) if analytics is not None else None
+        if cached is None:
+            # Use modular analytics (sharing one lowercased copy of the title)
+            title_lower = title.lower()
+            cached = (
+                self.topic_detector.detect(title, title_lower),
+                self.alert_detector.detect(title, title_lower),
+            )
+            if analytics is not None:
+                analytics[title] = cached
+
+        topics, alert = cached
 
         return NormalizedNewsItem(
             id=generate_id(url, f"gdelt-{category}"),
@@ -179,12 +225,12 @@ class GdeltConnector(BaseConnector):
             url=url,
             title=title,
             published_at=parse_gdelt_date(article.get("seendate", "")),
-            fetched_at=now_iso(),
+            fetched_at=fetched_at or now_iso(),
             authors=[],
             summary="",
             content_text="",
             tickers=[],
-            topics=topics,
+            topics=list(topics),
             language=article.get("language", "en"),
             metadata=NewsMetadata(
                 category=category,
@@ -192,6 +238,6 @@ class GdeltConnector(BaseConnector):
                 alert_keyword=alert.keyword,
                 domain=article.get("domain"),
                 image_url=article.get("socialimage"),
-                raw=article,
+                raw=article if self.keep_raw else None,
             ),
         )
@@ -0,0 +1,114 @@
+"""
+httpx transport
+
+Adapts an httpx.AsyncClient to the part of the aiohttp.ClientSession
+interface the connectors use, so either library can carry their requests.
+"""
+
+import asyncio
+import importlib.util
+from typing import Optional
+
+import aiohttp
+
+try:
+    import httpx
+except ImportError:  # Optional dependency: httpx
+    httpx = None
+
+# HTTP/2 needs the h2 package (installed by the httpx[http2] extra)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class HttpxSession:
+    """
+    aiohttp-style session backed by httpx.
+
+    With h2 installed, requests to the same host (e.g. a CORS proxy serving
+    every feed) are multiplexed over one HTTP/2 connection. httpx has no
+    per-host connection limit, so only the total limit applies.
+
+    Over HTTP/1.1 it is slower than the default aiohttp transport (about
+    540 ms vs 370 ms for 200 local 50-item feeds), so it only pays off
+    when many requests share one HTTP/2 host.
+
+    Example usage:
+        session = HttpxSession(timeout=15)
+        connector = RSSConnector(session=session)
+        items = await connector.fetch()
+        await session.close()
+    """
+
+    def __init__(self, timeout: float, connector_limit: int = 256):
+        """
+        Initialize the session.
+
+        Args:
+            timeout: Default request timeout in seconds.
+            connector_limit: Max open connections.
+        """
+        if httpx is None:
+            raise ImportError('transport="httpx" requires httpx (pip install "httpx[http2]")')
+
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=connector_limit),
+            follow_redirects=True,  # as aiohttp does
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def get(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> "_HttpxRequest":
+        """Start a GET request (use as `async with session.get(url) as response`)."""
+        return _HttpxRequest(self._client, url, timeout, headers)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class _HttpxRequest:
+    """Async context manager performing one request."""
+
+    def __init__(self, client, url: str, timeout: Optional[float], headers: Optional[dict]):
+        self._client = client
+        self._url = url
+        self._timeout = timeout
+        self._headers = headers
+
+    async def __aenter__(self) -> "_HttpxResponse":
+        kwargs = {"headers": self._headers}
+        if self._timeout is not None:
+            kwargs["timeout"] = self._timeout
+
+        # Surface errors as the aiohttp/asyncio exceptions the connectors handle
+        try:
+            response = await self._client.get(self._url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError() from e
+        except httpx.HTTPError as e:
+            raise aiohttp.ClientError(str(e)) from e
+        return _HttpxResponse(response)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class _HttpxResponse:
+    """Read-side view of an httpx response with aiohttp's attribute names."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.charset = response.charset_encoding
+
+    async def read(self) -> bytes:
+        return self._response.content
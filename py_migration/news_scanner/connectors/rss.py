@@ -5,12 +5,21 @@ Fetches and parses RSS/Atom feeds from various news sources.
 """
 
 import asyncio
+import codecs
+import io
 import re
-from typing import Optional
+from html import unescape
+from html.entities import html5
+from typing import Iterator, Optional, Sequence, Union
 from urllib.parse import quote
 
 import aiohttp
 
+try:
+    from lxml import etree
+except ImportError:  # Optional dependency: lxml
+    etree = None
+
 from .base import BaseConnector
 from ..models import NormalizedNewsItem, NewsMetadata, FeedSource
 from ..utils import (
@@ -20,26 +29,69 @@ from ..utils.config import FEEDS, INTEL_SOURCES
 from ..analytics import TopicDetector, AlertDetector, TickerExtractor
 
 
+# RSS/Atom parsing patterns over the raw feed bytes (compiled once, applied per item)
+_TITLE_RE = re.compile(rb'<title[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</title>', re.DOTALL | re.IGNORECASE)
+_LINK_HREF_RE = re.compile(rb'<link[^>]*href=["\']([^"\']+)["\']', re.IGNORECASE)
+_LINK_CONTENT_RE = re.compile(rb'<link[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</link>', re.DOTALL | re.IGNORECASE)
+_DESC_RE = re.compile(rb'<(?:description|summary)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:description|summary)>', re.DOTALL | re.IGNORECASE)
+_CONTENT_RE = re.compile(rb'<(?:content:encoded|content)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:content:encoded|content)>', re.DOTALL | re.IGNORECASE)
+_DATE_RE = re.compile(rb'<(?:pubDate|updated|published)[^>]*>(.*?)</(?:pubDate|updated|published)>', re.DOTALL | re.IGNORECASE)
+_AUTHOR_RE = re.compile(rb'<(?:author|dc:creator|creator)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:author|dc:creator|creator)>', re.DOTALL | re.IGNORECASE)
+
+# Leading XML declaration of already-decoded text (its encoding no longer applies)
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+# Characters that may follow an item/entry tag name
+_TAG_NAME_END = frozenset((b' ', b'\t', b'\n', b'\r', b'\f', b'\v', b'>'))
+
+# Encoding named by the XML declaration of raw feed bytes
+_XML_ENCODING_RE = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([\w.:-]+)["\']')
+# Byte order marks, which also fix a feed's encoding
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+# CDATA content is literal text; everything else is entity-escaped
+_CDATA_OPEN = b'<![CDATA['
+# CDATA sections (left as is) or an '&' with its entity reference, if any.
+# Sloppy feeds use bare '&' and HTML entities (&nbsp;), which are not XML;
+# lxml's recovery would silently drop them.
+_ENTITY_FIXUP_RE = re.compile(rb'<!\[CDATA\[.*?\]\]>|&(?:(#?\w+);)?', re.DOTALL)
+_XML_ENTITIES = frozenset((b'amp', b'lt', b'gt', b'quot', b'apos'))
+
+# Item child elements read by the lxml parser, by source-level (prefixed) name
+_LXML_FIELDS = {
+    'title': 'title',
+    'link': 'link',
+    'description': 'description',
+    'summary': 'description',
+    'content:encoded': 'content',
+    'content': 'content',
+    'pubDate': 'pubDate',
+    'updated': 'pubDate',
+    'published': 'pubDate',
+    'author': 'author',
+    'dc:creator': 'author',
+    'creator': 'author',
+}
+
+
 class RSSConnector(BaseConnector):
     """
     Connector for RSS/Atom feeds.
 
     Example usage:
-        connector = RSSConnector()
+        # The connector's session is closed when the block exits
+        async with RSSConnector() as connector:
+            # Fetch single category
+            items = await connector.fetch_category("finance")
 
-        # Fetch single category
-        items = await connector.fetch_category("finance")
+            # Fetch all categories
+            items = await connector.fetch()
 
-        # Fetch all categories
-        items = await connector.fetch()
+            # Fetch intel sources
+            items = await connector.fetch_intel()
 
-        # Fetch intel sources
-        items = await connector.fetch_intel()
-
-        # Fetch custom feed
-        items = await connector.fetch_feed(
-            FeedSource("My Feed", "https://example.com/rss.xml", "tech")
-        )
+            # Fetch custom feed
+            items = await connector.fetch_feed(
+                FeedSource("My Feed", "https://example.com/rss.xml", "tech")
+            )
     """
 
     def __init__(
@@ -47,6 +99,11 @@ class RSSConnector(BaseConnector):
         cors_proxies: Optional[list[str]] = None,
         timeout: int = 12,
         use_proxy: bool = True,
+        keep_raw: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+        connector_limit: int = 256,
+        limit_per_host: int = 8,
+        transport: str = "aiohttp",
     ):
         """
         Initialize RSS connector.
@@ -55,10 +112,21 @@ class RSSConnector(BaseConnector):
             cors_proxies: List of CORS proxy URLs (for browser env).
             timeout: Request timeout in seconds.
             use_proxy: Whether to use CORS proxy.
+            keep_raw: Keep the source payload in metadata.raw.
+            session: HTTP session to use for all requests (left open by
+                close()). One is created on first use if None.
+            connector_limit: Max open connections of the created session.
+            limit_per_host: Max open connections per host of the created session.
+            transport: HTTP library of the created session, "aiohttp" or
+                "httpx" (optional dependency; HTTP/2 with h2 installed).
         """
         self.cors_proxies = cors_proxies or config.cors_proxies
         self.timeout = timeout
         self.use_proxy = use_proxy
+        self.keep_raw = keep_raw
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
+        self._use_session(session, transport)
 
         # Analytics (modular)
         self.topic_detector = TopicDetector()
@@ -82,55 +150,58 @@ class RSSConnector(BaseConnector):
         if categories is None:
             categories = list(FEEDS.keys())
 
-        all_items = []
-
+        feeds = []
         for category in categories:
-            items = await self.fetch_category(category, **kwargs)
-            all_items.extend(items)
+            category_feeds = FEEDS.get(category, [])
+            if not category_feeds:
+                logger.debug("No RSS feeds for category: %s", category)
+            feeds.extend(category_feeds)
 
-        return all_items
+        # All feeds of all categories share one concurrency limit
+        results = await self._fetch_feeds(feeds)
+        return [item for items in results for item in items]
 
-    async def fetch_category(self, category: str, **kwargs) -> list[NormalizedNewsItem]:
+    async def fetch_category(
+        self,
+        category: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs
+    ) -> list[NormalizedNewsItem]:
         """
         Fetch all feeds for a category.
 
         Args:
             category: News category.
+            session: HTTP session. Defaults to the connector's session.
 
         Returns:
             List of normalized news items.
         """
         feeds = FEEDS.get(category, [])
         if not feeds:
-            logger.debug(f"No RSS feeds for category: {category}")
+            logger.debug("No RSS feeds for category: %s", category)
             return []
 
-        all_items = []
-
-        for i, feed in enumerate(feeds):
-            if i > 0:
-                await asyncio.sleep(config.delay_between_requests)
+        results = await self._fetch_feeds(feeds, session)
+        return [item for items in results for item in items]
 
-            items = await self.fetch_feed(feed)
-            all_items.extend(items)
-
-        return all_items
-
-    async def fetch_intel(self) -> list[NormalizedNewsItem]:
+    async def fetch_intel(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> list[NormalizedNewsItem]:
         """
         Fetch intel sources (think tanks, OSINT, etc.)
 
+        Args:
+            session: HTTP session. Defaults to the connector's session.
+
         Returns:
             List of normalized news items.
         """
         all_items = []
+        results = await self._fetch_feeds(INTEL_SOURCES, session)
 
-        for i, source in enumerate(INTEL_SOURCES):
-            if i > 0:
-                await asyncio.sleep(config.delay_between_requests)
-
-            items = await self.fetch_feed(source)
-
+        for source, items in zip(INTEL_SOURCES, results):
             # Add intel metadata
             for item in items:
                 item.metadata.raw = {
@@ -143,19 +214,38 @@ class RSSConnector(BaseConnector):
 
         return all_items
 
-    async def fetch_feed(self, source: FeedSource) -> list[NormalizedNewsItem]:
+    async def _fetch_feeds(
+        self,
+        feeds: Sequence[FeedSource],
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> list[list[NormalizedNewsItem]]:
+        """Fetch feeds concurrently over one session; results in feed order."""
+        if session is None:
+            session = self._get_session()
+
+        return await self._gather_bounded(
+            lambda feed: self.fetch_feed(feed, session=session),
+            feeds,
+        )
+
+    async def fetch_feed(
+        self,
+        source: FeedSource,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> list[NormalizedNewsItem]:
         """
         Fetch a single RSS feed.
 
         Args:
             source: Feed source configuration.
+            session: HTTP session. Defaults to the connector's session.
 
         Returns:
             List of normalized news items.
         """
-        logger.debug(f"Fetching RSS {source.name}: {source.url}")
+        logger.debug("Fetching RSS %s: %s", source.name, source.url)
 
-        xml = await self._fetch_with_proxy(source.url)
+        xml = await self._fetch_with_proxy(source.url, session)
         if not xml:
             logger.warning(f"RSS {source.name}: Failed to fetch")
             return []
@@ -163,102 +253,232 @@ class RSSConnector(BaseConnector):
         items = self._parse_rss(xml)
         logger.info(f"RSS {source.name}: {len(items)} items")
 
+        # Feeds can repeat an item's text; analyze identical text once
+        analytics: dict[tuple[str, str], tuple] = {}
+        fetched_at = now_iso()
+
         return [
-            self._transform_item(item, source)
+            self._transform_item(item, source, analytics, fetched_at)
             for item in items
         ]
 
-    async def _fetch_with_proxy(self, url: str) -> Optional[str]:
-        """Fetch URL with CORS proxy fallback."""
+    async def _fetch_with_proxy(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Optional[bytes]:
+        """Fetch URL with CORS proxy fallback, returning the raw body."""
+        if session is None:
+            session = self._get_session()
+
         proxies = self.cors_proxies if self.use_proxy else [""]
 
         for proxy in proxies:
             try:
                 fetch_url = f"{proxy}{quote(url, safe='')}" if proxy else url
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        fetch_url,
-                        timeout=self.timeout,
-                        headers={"Accept": "application/rss+xml, application/xml, text/xml, */*"}
-                    ) as response:
-                        if response.status != 200:
-                            logger.debug(f"RSS proxy failed ({response.status}): {proxy}")
-                            continue
+                async with session.get(
+                    fetch_url,
+                    timeout=self.timeout,
+                    headers={"Accept": "application/rss+xml, application/xml, text/xml, */*"}
+                ) as response:
+                    if response.status != 200:
+                        logger.debug("RSS proxy failed (%s): %s", response.status, proxy)
+                        continue
 
-                        text = await response.text()
+                    # Raw bytes: the parsers decode per field (or let lxml
+                    # apply the feed's declared encoding)
+                    body = await response.read()
+                    body = _apply_charset(body, response.charset)
 
-                        # Validate XML
-                        if not text or '<!DOCTYPE html>' in text.lower():
-                            continue
+                    # Validate XML (proxies return HTML error pages)
+                    if not body or b'<!doctype html' in body[:1024].lower():
+                        continue
 
-                        return text
+                    return body
 
             except asyncio.TimeoutError:
-                logger.debug(f"RSS proxy timeout: {proxy}")
+                logger.debug("RSS proxy timeout: %s", proxy)
             except aiohttp.ClientError as e:
-                logger.debug(f"RSS proxy error: {proxy} - {e}")
+                logger.debug("RSS proxy error: %s - %s", proxy, e)
 
         return None
 
-    def _parse_rss(self, xml: str) -> list[dict]:
-        """Parse RSS/Atom XML to list of items."""
+    def _parse_rss(self, xml: Union[str, bytes]) -> list[dict]:
+        """
+        Parse RSS/Atom XML to list of items.
+
+        Streams the document through lxml when installed; falls back to the
+        regex parser without lxml or when the feed is not parseable XML.
+        """
+        if isinstance(xml, str):
+            xml = _XML_DECL_RE.sub('', xml, count=1).encode('utf-8')
+
+        if etree is not None:
+            try:
+                return self._parse_rss_lxml(xml)
+            except (etree.Error, ValueError) as e:
+                logger.debug("RSS lxml parse failed, using regex parser: %s", e)
+
+        return self._parse_rss_regex(xml)
+
+    def _parse_rss_lxml(self, xml: bytes) -> list[dict]:
+        """Parse RSS/Atom XML with lxml's streaming iterparse."""
         items = []
+        data = xml.lstrip()
+        if b'&' in data:
+            data = _ENTITY_FIXUP_RE.sub(_fix_entity, data)
+
+        context = etree.iterparse(
+            io.BytesIO(data),
+            events=('end',),
+            tag=('{*}item', '{*}entry'),
+            recover=True,
+            huge_tree=False,
+        )
 
-        # Match <item> or <entry> tags
-        item_pattern = re.compile(r'<(?:item|entry)[\s>](.*?)</(?:item|entry)>', re.DOTALL | re.IGNORECASE)
+        for _, elem in context:
+            # First occurrence of each field wins, in document order
+            found: dict[str, etree._Element] = {}
+            link_href = None
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    continue  # Comments / processing instructions
+                name = child.tag.rpartition('}')[2]
+                if child.prefix:
+                    name = f"{child.prefix}:{name}"
+                field = _LXML_FIELDS.get(name)
+                if field is None:
+                    continue
+                if name == 'link' and link_href is None:
+                    link_href = child.get('href')
+                found.setdefault(field, child)
 
-        for match in item_pattern.finditer(xml):
-            item_xml = match.group(1)
+            item = {}
+
+            if 'title' in found:
+                item['title'] = strip_html(_element_text(found['title']))
+
+            # Link (Atom href attribute or RSS element text)
+            link_text = _element_text(found['link']) if 'link' in found else None
+            item['link'] = link_href or link_text or None
+
+            if 'description' in found:
+                item['description'] = strip_html(_element_text(found['description']))
+
+            if 'content' in found:
+                item['content'] = strip_html(_element_text(found['content']))
+
+            if 'pubDate' in found:
+                item['pubDate'] = _element_text(found['pubDate'])
+
+            if 'author' in found:
+                item['author'] = strip_html(_element_text(found['author']))
+
+            if item.get('title') or item.get('link'):
+                items.append(item)
+
+            # Free parsed items as we go
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        # Recovery drops whatever it cannot parse without raising; let the
+        # regex parser handle malformed feeds instead. Undeclared namespace
+        # prefixes (e.g. dc:) are common and harmless, so they don't count.
+        for error in context.error_log:
+            if error.domain_name != 'NAMESPACE':
+                raise ValueError(f"malformed feed: {error.message}")
+
+        return items
+
+    def _parse_rss_regex(self, xml: bytes) -> list[dict]:
+        """Parse RSS/Atom XML to list of items with regexes."""
+        items = []
+
+        encoding = 'utf-8'
+        declared = _XML_ENCODING_RE.match(xml)
+        if declared:
+            try:
+                encoding = codecs.lookup(declared.group(1).decode('ascii')).name
+            except LookupError:
+                pass
+
+        # Match <item> or <entry> tags
+        for item_xml in _iter_items(xml):
             item = {}
 
             # Title
-            title_match = re.search(r'<title[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</title>', item_xml, re.DOTALL | re.IGNORECASE)
+            title_match = _TITLE_RE.search(item_xml)
             if title_match:
-                item['title'] = strip_html(title_match.group(1).strip())
+                item['title'] = strip_html(_field_text(title_match, encoding))
 
             # Link (RSS or Atom style)
-            link_href = re.search(r'<link[^>]*href=["\']([^"\']+)["\']', item_xml, re.IGNORECASE)
-            link_content = re.search(r'<link[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</link>', item_xml, re.DOTALL | re.IGNORECASE)
-            item['link'] = (link_href.group(1) if link_href else None) or \
-                           (link_content.group(1).strip() if link_content else None)
+            link_href = _LINK_HREF_RE.search(item_xml)
+            link_content = _LINK_CONTENT_RE.search(item_xml)
+            item['link'] = (_field_text(link_href, encoding) if link_href else None) or \
+                           (_field_text(link_content, encoding) if link_content else None)
 
             # Description/Summary
-            desc_match = re.search(r'<(?:description|summary)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:description|summary)>', item_xml, re.DOTALL | re.IGNORECASE)
+            desc_match = _DESC_RE.search(item_xml)
             if desc_match:
-                item['description'] = strip_html(desc_match.group(1).strip())
+                item['description'] = strip_html(_field_text(desc_match, encoding))
 
             # Content
-            content_match = re.search(r'<(?:content:encoded|content)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:content:encoded|content)>', item_xml, re.DOTALL | re.IGNORECASE)
+            content_match = _CONTENT_RE.search(item_xml)
             if content_match:
-                item['content'] = strip_html(content_match.group(1).strip())
+                item['content'] = strip_html(_field_text(content_match, encoding))
 
             # Date
-            date_match = re.search(r'<(?:pubDate|updated|published)[^>]*>(.*?)</(?:pubDate|updated|published)>', item_xml, re.DOTALL | re.IGNORECASE)
+            date_match = _DATE_RE.search(item_xml)
             if date_match:
-                item['pubDate'] = date_match.group(1).strip()
+                item['pubDate'] = _field_text(date_match, encoding)
 
             # Author
-            author_match = re.search(r'<(?:author|dc:creator|creator)[^>]*>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</(?:author|dc:creator|creator)>', item_xml, re.DOTALL | re.IGNORECASE)
+            author_match = _AUTHOR_RE.search(item_xml)
             if author_match:
-                item['author'] = strip_html(author_match.group(1).strip())
+                item['author'] = strip_html(_field_text(author_match, encoding))
 
             if item.get('title') or item.get('link'):
                 items.append(item)
 
         return items
 
-    def _transform_item(self, item: dict, source: FeedSource) -> NormalizedNewsItem:
-        """Transform RSS item to normalized schema."""
+    def _transform_item(
+        self,
+        item: dict,
+        source: FeedSource,
+        analytics: Optional[dict[tuple[str, str], tuple]] = None,
+        fetched_at: Optional[str] = None,
+    ) -> NormalizedNewsItem:
+        """
+        Transform RSS item to normalized schema.
+
+        Args:
+            item: Parsed RSS item.
+            source: Feed source configuration.
+            analytics: Optional (title, full_text) -> (topics, alert, tickers)
+                memo shared across the items of one feed.
+            fetched_at: Fetch timestamp shared by the feed. Defaults to now.
+        """
         title = item.get("title", "")
         description = item.get("description", "")
         content = item.get("content", "")
         full_text = f"{title} {description} {content}"
 
-        # Use modular analytics
-        topics = self.topic_detector.detect(full_text)
-        alert = self.alert_detector.detect(title)
-        tickers = self.ticker_extractor.extract(full_text)
+        key = (title, full_text)
+        cached = analytics.get(key) if analytics is not None else None
+        if cached is None:
+            # Use modular analytics
+            cached = (
+                self.topic_detector.detect(full_text),
+                self.alert_detector.detect(title),
+                self.ticker_extractor.extract(full_text),
+            )
+            if analytics is not None:
+                analytics[key] = cached
+
+        topics, alert, tickers = cached
 
         url = item.get("link", "")
         author = item.get("author")
@@ -269,17 +489,119 @@ class RSSConnector(BaseConnector):
             url=url,
             title=title,
             published_at=parse_rss_date(item.get("pubDate", "")),
-            fetched_at=now_iso(),
+            fetched_at=fetched_at or now_iso(),
             authors=[author] if author else [],
             summary=description,
             content_text=content or description,
-            tickers=tickers,
-            topics=topics,
+            tickers=list(tickers),
+            topics=list(topics),
             language="en",
             metadata=NewsMetadata(
                 category=source.category,
                 is_alert=alert.is_alert,
                 alert_keyword=alert.keyword,
-                raw=item,
+                raw=item if self.keep_raw else None,
             ),
         )
+
+
+def _fix_entity(match: re.Match) -> bytes:
+    """Make an _ENTITY_FIXUP_RE match valid XML (CDATA is returned unchanged)."""
+    text = match.group(0)
+    if text.startswith(b'<'):
+        return text
+    name = match.group(1)
+    if name is None:
+        return b'&amp;'  # Bare '&'
+    if name.startswith(b'#') or name in _XML_ENTITIES:
+        return text
+    chars = html5.get(name.decode('ascii') + ';')
+    if chars is None:
+        return b'&amp;' + name + b';'  # Unknown entity: keep it as text
+    return b''.join(b'&#%d;' % ord(ch) for ch in chars)
+
+
+def _element_text(elem) -> str:
+    """All text inside an element (CDATA included), stripped."""
+    if len(elem) == 0:
+        # Leaf element (the usual case): its text is all there is
+        return (elem.text or '').strip()
+    return ''.join(elem.itertext()).strip()
+
+
+def _iter_items(xml: bytes) -> Iterator[bytes]:
+    """
+    Yield the inner XML of each <item>/<entry> element.
+
+    A linear bytes.find scan over a lowercased copy (tags match
+    case-insensitively), with no regex backtracking on malformed feeds.
+    """
+    lowered = xml.lower()
+    pos = 0
+
+    while True:
+        item_start = lowered.find(b'<item', pos)
+        entry_start = lowered.find(b'<entry', pos)
+        if item_start < 0 and entry_start < 0:
+            return
+
+        if entry_start < 0 or 0 <= item_start < entry_start:
+            start, tag = item_start, b'item'
+        else:
+            start, tag = entry_start, b'entry'
+
+        # Content starts after the tag name and one whitespace/'>' character
+        body_start = start + len(tag) + 2
+        if lowered[body_start - 1:body_start] not in _TAG_NAME_END:
+            pos = start + 1  # e.g. <itemCount>, not an item
+            continue
+
+        # Either closing tag ends the item (tolerates mismatched feeds)
+        item_end = lowered.find(b'</item>', body_start)
+        entry_end = lowered.find(b'</entry>', body_start)
+        if item_end < 0 and entry_end < 0:
+            return
+
+        if entry_end < 0 or 0 <= item_end < entry_end:
+            end, close_len = item_end, len(b'</item>')
+        else:
+            end, close_len = entry_end, len(b'</entry>')
+
+        yield xml[body_start:end]
+        pos = end + close_len
+
+
+def _apply_charset(body: bytes, charset: Optional[str]) -> bytes:
+    """
+    Re-encode a feed body to UTF-8 from the HTTP Content-Type charset.
+
+    A BOM or an XML declaration naming the encoding takes precedence, as
+    the parsers read those themselves; so does an unknown charset.
+    """
+    if not charset or body.startswith(_BOMS) or _XML_ENCODING_RE.match(body):
+        return body
+    try:
+        encoding = codecs.lookup(charset).name
+    except LookupError:
+        return body
+    if encoding in ('utf-8', 'ascii'):
+        return body
+    return body.decode(encoding, 'replace').encode('utf-8')
+
+
+def _field_text(match: re.Match, encoding: str) -> str:
+    """
+    Text of a matched field with XML escapes undone, as lxml reports it.
+
+    Feeds usually entity-escape HTML (&lt;p&gt;); CDATA content is literal.
+    """
+    text = _decode(match.group(1), encoding)
+    start = match.start(1)
+    if match.string[start - len(_CDATA_OPEN):start] == _CDATA_OPEN:
+        return text
+    return unescape(text) if '&' in text else text
+
+
+def _decode(raw: bytes, encoding: str = 'utf-8') -> str:
+    """Decode a matched feed fragment, stripped."""
+    return raw.decode(encoding, 'replace').strip()
@@ -4,12 +4,29 @@ Data models for the news scanner.
 Uses Pydantic for validation and serialization.
 """
 
+import sys
 from datetime import datetime
 from typing import Optional, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional dependency: orjson
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # Optional dependency: ciso8601
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Models are created per item, so use __slots__ (no per-instance __dict__)
+# where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class NewsCategory(str, Enum):
     """News category types."""
@@ -22,7 +39,7 @@ class NewsCategory(str, Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NewsMetadata:
     """Extended metadata for news items."""
     category: Optional[str] = None
@@ -35,11 +52,23 @@ class NewsMetadata:
 
     def to_dict(self) -> dict:
         """Convert to dictionary, excluding None values and raw."""
-        return {k: v for k, v in asdict(self).items()
-                if v is not None and k != 'raw'}
+        data = {}
+        if self.category is not None:
+            data['category'] = self.category
+        if self.is_alert is not None:
+            data['is_alert'] = self.is_alert
+        if self.alert_keyword is not None:
+            data['alert_keyword'] = self.alert_keyword
+        if self.region is not None:
+            data['region'] = self.region
+        if self.domain is not None:
+            data['domain'] = self.domain
+        if self.image_url is not None:
+            data['image_url'] = self.image_url
+        return data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NormalizedNewsItem:
     """
     Normalized news item schema.
@@ -60,17 +89,67 @@ class NormalizedNewsItem:
     language: str = "en"
     metadata: NewsMetadata = field(default_factory=NewsMetadata)
 
+    # Derived values memoized for filters, keyed on the fields they derive
+    # from so they stay correct if those are reassigned
+    _search_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _published_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased "title summary" text used for keyword matching."""
+        cache = self._search_cache
+        if cache is None or cache[0] is not self.title or cache[1] is not self.summary:
+            cache = (self.title, self.summary, f"{self.title} {self.summary}".lower())
+            self._search_cache = cache
+        return cache[2]
+
+    @property
+    def published_datetime(self) -> Optional[datetime]:
+        """Naive datetime of published_at (offset dropped), None if unparseable."""
+        cache = self._published_cache
+        if cache is None or cache[0] is not self.published_at:
+            try:
+                parsed = _parse_iso_datetime(self.published_at).replace(tzinfo=None)
+            except (ValueError, TypeError, AttributeError):
+                parsed = None
+            cache = (self.published_at, parsed)
+            self._published_cache = cache
+        return cache[1]
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Convert metadata to dict
-        if isinstance(self.metadata, NewsMetadata):
-            data['metadata'] = self.metadata.to_dict()
-        return data
+        # Built field by field: asdict() would deep-copy every value,
+        # including metadata.raw, only for metadata to be replaced below
+        metadata = self.metadata
+        if isinstance(metadata, NewsMetadata):
+            metadata = metadata.to_dict()
+
+        return {
+            'id': self.id,
+            'source': self.source,
+            'url': self.url,
+            'title': self.title,
+            'published_at': self.published_at,
+            'fetched_at': self.fetched_at,
+            'authors': list(self.authors),
+            'summary': self.summary,
+            'content_text': self.content_text,
+            'tickers': list(self.tickers),
+            'topics': list(self.topics),
+            'language': self.language,
+            'metadata': metadata,
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode('utf-8')
+        # Same compact, non-ASCII-escaping output as orjson
+        return json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False)
 
     @classmethod
     def from_dict(cls, data: dict) -> "NormalizedNewsItem":
@@ -83,7 +162,7 @@ class NormalizedNewsItem:
         return cls(**data, metadata=metadata)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PipelineError:
     """Error that occurred during pipeline execution."""
     stage: str  # 'fetch', 'parse', 'filter', 'dedup', 'store'
@@ -91,8 +170,17 @@ class PipelineError:
     message: str
     timestamp: str
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            'stage': self.stage,
+            'source': self.source,
+            'message': self.message,
+            'timestamp': self.timestamp,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class PipelineStats:
     """Statistics from pipeline execution."""
     fetched: int = 0
@@ -102,8 +190,19 @@ class PipelineStats:
     stored: int = 0
     duration_ms: int = 0
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            'fetched': self.fetched,
+            'parsed': self.parsed,
+            'filtered': self.filtered,
+            'deduplicated': self.deduplicated,
+            'stored': self.stored,
+            'duration_ms': self.duration_ms,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class PipelineResult:
     """Result of pipeline execution."""
     items: list[NormalizedNewsItem]
@@ -114,12 +213,13 @@ class PipelineResult:
         """Convert to dictionary."""
         return {
             'items': [item.to_dict() for item in self.items],
-            'stats': asdict(self.stats),
-            'errors': [asdict(e) for e in self.errors],
+            'stats': self.stats.to_dict(),
+            'errors': [e.to_dict() for e in self.errors],
         }
 
 
-@dataclass
+# Source definitions are static configuration, so they are immutable
+@dataclass(frozen=True, **_SLOTS)
 class FeedSource:
     """RSS feed source configuration."""
     name: str
@@ -127,7 +227,7 @@ class FeedSource:
     category: str = "general"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IntelSource(FeedSource):
     """Intel source with additional metadata."""
     source_type: str = "general"  # 'think-tank', 'defense', 'osint', 'cyber'
@@ -4,14 +4,31 @@ News item normalizer.
 Ensures all fields are properly set and enriched.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from ..models import NormalizedNewsItem, NewsMetadata
 from ..analytics import TopicDetector, AlertDetector, TickerExtractor, RegionDetector
+from ..analytics.alerts import AlertResult
 from ..utils import now_iso, extract_domain
 from .text import clean_text, extract_summary
 
 
+# Feeds often repeat the same titles and short summaries (across fields and
+# across fetches), so cleaned results are cached per raw string. Longer text
+# such as article content is cleaned directly instead of being kept alive
+# by the cache.
+_CACHED_TEXT_MAX_LENGTH = 512
+_clean_text_cached = lru_cache(maxsize=8192)(clean_text)
+
+
+def _clean_text(text: str) -> str:
+    """clean_text, cached for strings up to _CACHED_TEXT_MAX_LENGTH."""
+    if len(text) > _CACHED_TEXT_MAX_LENGTH:
+        return clean_text(text)
+    return _clean_text_cached(text)
+
+
 class Normalizer:
     """
     Normalizes news items.
@@ -65,24 +82,76 @@ class Normalizer:
         Returns:
             Normalized news item.
         """
-        # Clean text fields
-        title = clean_text(item.title)
-        summary = clean_text(item.summary) if item.summary else ""
-        content = clean_text(item.content_text) if item.content_text else ""
+        return self.normalize_many([item])[0]
 
-        # Combine for analysis
-        full_text = f"{title} {summary} {content}"
+    def normalize_many(self, items: list[NormalizedNewsItem]) -> list[NormalizedNewsItem]:
+        """
+        Normalize multiple items.
+
+        Args:
+            items: List of items to normalize.
+
+        Returns:
+            List of normalized items.
+        """
+        # Each stage runs over the whole batch before the next one starts,
+        # so every detector's tables stay hot across consecutive items.
+
+        # Clean text fields
+        cleaned = [
+            (
+                _clean_text(item.title) if item.title else "",
+                _clean_text(item.summary) if item.summary else "",
+                _clean_text(item.content_text) if item.content_text else "",
+            )
+            for item in items
+        ]
+
+        # Combine for analysis; the lowercased copy is shared by the detectors
+        texts = [f"{title} {summary} {content}" for title, summary, content in cleaned]
+        texts_lower = [text.lower() for text in texts]
 
         # Extract/detect if not already set
-        topics = item.topics if item.topics else self.topic_detector.detect(full_text)
-        tickers = item.tickers if item.tickers else self.ticker_extractor.extract(full_text)
+        detect_topics = self.topic_detector.detect
+        topics = [
+            item.topics if item.topics else detect_topics(text, text_lower)
+            for item, text, text_lower in zip(items, texts, texts_lower)
+        ]
+
+        extract_tickers = self.ticker_extractor.extract
+        tickers = [
+            item.tickers if item.tickers else extract_tickers(text)
+            for item, text in zip(items, texts)
+        ]
 
         # Always run alert detection on title
-        alert = self.alert_detector.detect(title)
+        detect_alert = self.alert_detector.detect
+        alerts = [detect_alert(title) for title, _, _ in cleaned]
 
         # Detect region
-        region = item.metadata.region if item.metadata and item.metadata.region else \
-                 self.region_detector.detect(full_text)
+        detect_region = self.region_detector.detect
+        regions = [
+            item.metadata.region if item.metadata and item.metadata.region else
+            detect_region(text, text_lower)
+            for item, text, text_lower in zip(items, texts, texts_lower)
+        ]
+
+        return [
+            self._build(item, *fields)
+            for item, *fields in zip(items, cleaned, topics, tickers, alerts, regions)
+        ]
+
+    def _build(
+        self,
+        item: NormalizedNewsItem,
+        cleaned: tuple[str, str, str],
+        topics: list[str],
+        tickers: list[str],
+        alert: AlertResult,
+        region: Optional[str],
+    ) -> NormalizedNewsItem:
+        """Assemble the normalized item from cleaned text and detections."""
+        title, summary, content = cleaned
 
         # Create metadata
         metadata = NewsMetadata(
@@ -110,15 +179,3 @@ class Normalizer:
             language=item.language or "en",
             metadata=metadata,
         )
-
-    def normalize_many(self, items: list[NormalizedNewsItem]) -> list[NormalizedNewsItem]:
-        """
-        Normalize multiple items.
-
-        Args:
-            items: List of items to normalize.
-
-        Returns:
-            List of normalized items.
-        """
-        return [self.normalize(item) for item in items]
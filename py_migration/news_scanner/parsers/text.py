@@ -3,9 +3,30 @@ Text parsing utilities.
 """
 
 import re
-from html import unescape
 from typing import Optional
 
+from ..utils import strip_html, last_sentence_end
+
+try:
+    import re2
+except ImportError:  # Optional dependency: google-re2
+    re2 = None
+
+
+# TextParser patterns (compiled once). The quote patterns run on RE2 when
+# installed; sentence splitting needs lookbehind and numbers need Unicode
+# \d, neither of which RE2 provides, so those stay on `re`.
+_fast_re = re2 if re2 is not None else re
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# One pattern per quote style: as alternatives of one pattern, an
+# apostrophe pair ("CEO's ... board's") would swallow a real quote inside it
+_QUOTE_RES = tuple(_fast_re.compile(pattern) for pattern in (
+    r'"([^"]+)"',       # Double quotes
+    r"'([^']+)'",       # Single quotes
+    r'«([^»]+)»',       # Guillemets
+))
+_NUMBER_RE = re.compile(r'[-+]?\$?\d+(?:,\d{3})*(?:\.\d+)?%?')
+
 
 def clean_text(text: str) -> str:
     """
@@ -16,25 +37,7 @@ def clean_text(text: str) -> str:
     - Normalizes whitespace
     - Removes common RSS artifacts
     """
-    if not text:
-        return ""
-
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-
-    # Decode HTML entities
-    text = unescape(text)
-
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    # Remove common RSS artifacts
-    text = re.sub(r'\[…\]', '...', text)
-    text = re.sub(r'\[\.\.\.\]', '...', text)
-    text = re.sub(r'Continue reading\.\.\.?$', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'Read more\.\.\.?$', '', text, flags=re.IGNORECASE)
-
-    return text.strip()
+    return strip_html(text)
 
 
 def extract_summary(content: str, max_length: int = 300) -> str:
@@ -55,11 +58,7 @@ def extract_summary(content: str, max_length: int = 300) -> str:
     truncated = clean[:max_length]
 
     # Find last sentence ending
-    last_period = truncated.rfind('.')
-    last_question = truncated.rfind('?')
-    last_exclaim = truncated.rfind('!')
-
-    boundary = max(last_period, last_question, last_exclaim)
+    boundary = last_sentence_end(truncated)
 
     if boundary > max_length * 0.5:
         return clean[:boundary + 1]
@@ -101,8 +100,8 @@ class TextParser:
             return []
 
         # Split on sentence endings
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        return [s for s in map(str.strip, sentences) if s]
 
     def extract_quotes(self, text: str) -> list[str]:
         """Extract quoted text."""
@@ -110,17 +109,9 @@ class TextParser:
             return []
 
         # Match various quote styles
-        patterns = [
-            r'"([^"]+)"',       # Double quotes
-            r"'([^']+)'",       # Single quotes
-            r'"([^"]+)"',       # Smart quotes
-            r'«([^»]+)»',       # Guillemets
-        ]
-
         quotes = []
-        for pattern in patterns:
-            quotes.extend(re.findall(pattern, text))
-
+        for pattern in _QUOTE_RES:
+            quotes.extend(pattern.findall(text))
         return quotes
 
     def extract_numbers(self, text: str) -> list[str]:
@@ -129,8 +120,7 @@ class TextParser:
             return []
 
         # Match various number formats
-        pattern = r'[-+]?\$?\d+(?:,\d{3})*(?:\.\d+)?%?'
-        return re.findall(pattern, text)
+        return _NUMBER_RE.findall(text)
 
     def word_count(self, text: str) -> int:
         """Count words in text."""
@@ -2,11 +2,12 @@
 Pipeline filters.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 
 from ..models import NormalizedNewsItem
+from ..analytics.matcher import KeywordMatcher
 
 
 @dataclass
@@ -50,6 +51,107 @@ class FilterConfig:
     # Ticker filter
     tickers: Optional[list[str]] = None
 
+    # Prepared lookups, reused while the settings above are unchanged
+    _plan_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def compile(self) -> Callable[[NormalizedNewsItem], bool]:
+        """
+        Build a single predicate equivalent to filter_items with this config.
+
+        Only the configured filters are checked, cheapest first, stopping
+        at the first failure. The age cutoff is fixed at compile time, so
+        compile again for each batch; the lookup sets and keyword matchers
+        are cached on the config, which makes that cheap.
+
+        Example usage:
+            keep = config.compile()
+            filtered = [item for item in items if keep(item)]
+        """
+        clauses = self._plan().clauses()
+
+        def predicate(item: NormalizedNewsItem) -> bool:
+            return all(clause(item) for clause in clauses)
+        return predicate
+
+    def _plan(self) -> "_FilterPlan":
+        """Prepared lookups for the current settings (rebuilt if they change)."""
+        key = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, f.name) for f in fields(self) if f.init)
+        )
+        cache = self._plan_cache
+        if cache is None or cache[0] != key:
+            cache = (key, _FilterPlan(self))
+            self._plan_cache = cache
+        return cache[1]
+
+
+class _FilterPlan:
+    """Lookup sets and keyword matchers prepared from a FilterConfig."""
+
+    def __init__(self, config: FilterConfig):
+        self.alerts_only = config.alerts_only
+        self.sources = frozenset(config.sources) if config.sources else None
+        self.exclude_sources = (
+            frozenset(config.exclude_sources) if config.exclude_sources else None
+        )
+        self.categories = frozenset(config.categories) if config.categories else None
+        self.regions = frozenset(config.regions) if config.regions else None
+        self.topics = frozenset(config.topics) if config.topics else None
+        self.tickers = frozenset(config.tickers) if config.tickers else None
+        self.include = _keyword_matcher(config.include_keywords)
+        self.exclude = _keyword_matcher(config.exclude_keywords)
+        self.max_age_hours = config.max_age_hours
+
+    def cutoff_time(self) -> Optional[datetime]:
+        """Oldest accepted publish time as of now (None without an age filter)."""
+        if not self.max_age_hours:
+            return None
+        return datetime.utcnow() - timedelta(hours=self.max_age_hours)
+
+    def clauses(self) -> list[Callable[[NormalizedNewsItem], bool]]:
+        """Per-item checks for the configured filters, cheapest first."""
+        clauses = []
+
+        if self.alerts_only:
+            clauses.append(lambda item: bool(item.metadata and item.metadata.is_alert))
+
+        sources, exclude_sources = self.sources, self.exclude_sources
+        if sources is not None:
+            clauses.append(lambda item: item.source in sources)
+        if exclude_sources is not None:
+            clauses.append(lambda item: item.source not in exclude_sources)
+
+        categories, regions = self.categories, self.regions
+        if categories is not None:
+            clauses.append(
+                lambda item: (item.metadata.category if item.metadata else None) in categories
+            )
+        if regions is not None:
+            clauses.append(
+                lambda item: (item.metadata.region if item.metadata else None) in regions
+            )
+
+        topics, tickers = self.topics, self.tickers
+        if topics is not None:
+            clauses.append(lambda item: not topics.isdisjoint(item.topics))
+        if tickers is not None:
+            clauses.append(lambda item: not tickers.isdisjoint(item.tickers))
+
+        include, exclude = self.include, self.exclude
+        if include is not None:
+            clauses.append(lambda item: include.matches(item.search_text))
+        if exclude is not None:
+            clauses.append(lambda item: not exclude.matches(item.search_text))
+
+        cutoff_time = self.cutoff_time()
+        if cutoff_time is not None:
+            clauses.append(lambda item: not _older_than(item, cutoff_time))
+
+        return clauses
+
 
 def filter_items(
     items: list[NormalizedNewsItem],
@@ -65,77 +167,23 @@ def filter_items(
     Returns:
         Filtered list of items.
     """
-    filtered = []
+    # Only the configured filters run, cheapest first, and each item stops
+    # at its first failing one. Input order is preserved.
+    keep = config.compile()
+    return [item for item in items if keep(item)]
 
-    # Pre-calculate cutoff time if needed
-    cutoff_time = None
-    if config.max_age_hours:
-        cutoff_time = datetime.utcnow() - timedelta(hours=config.max_age_hours)
 
-    for item in items:
-        # Category filter
-        if config.categories:
-            category = item.metadata.category if item.metadata else None
-            if category not in config.categories:
-                continue
-
-        # Region filter
-        if config.regions:
-            region = item.metadata.region if item.metadata else None
-            if region not in config.regions:
-                continue
-
-        # Topic filter
-        if config.topics:
-            if not any(t in config.topics for t in item.topics):
-                continue
-
-        # Include keywords
-        if config.include_keywords:
-            text = f"{item.title} {item.summary}".lower()
-            if not any(kw.lower() in text for kw in config.include_keywords):
-                continue
-
-        # Exclude keywords
-        if config.exclude_keywords:
-            text = f"{item.title} {item.summary}".lower()
-            if any(kw.lower() in text for kw in config.exclude_keywords):
-                continue
-
-        # Age filter
-        if cutoff_time:
-            try:
-                item_time = datetime.fromisoformat(
-                    item.published_at.replace('Z', '+00:00')
-                ).replace(tzinfo=None)
-                if item_time < cutoff_time:
-                    continue
-            except (ValueError, AttributeError):
-                pass
-
-        # Alerts only
-        if config.alerts_only:
-            if not (item.metadata and item.metadata.is_alert):
-                continue
-
-        # Source filter
-        if config.sources:
-            if item.source not in config.sources:
-                continue
-
-        # Exclude sources
-        if config.exclude_sources:
-            if item.source in config.exclude_sources:
-                continue
-
-        # Ticker filter
-        if config.tickers:
-            if not any(t in config.tickers for t in item.tickers):
-                continue
-
-        filtered.append(item)
-
-    return filtered
+def _keyword_matcher(keywords: Optional[list[str]]) -> Optional[KeywordMatcher]:
+    """One automaton over the lowercased keywords (None when there are none)."""
+    if not keywords:
+        return None
+    return KeywordMatcher((kw.lower(), kw) for kw in keywords)
+
+
+def _older_than(item: NormalizedNewsItem, cutoff_time: datetime) -> bool:
+    """Whether the item was published before the cutoff (unparseable dates pass)."""
+    item_time = item.published_datetime
+    return item_time is not None and item_time < cutoff_time
 
 
 class FilterPipeline:
@@ -161,6 +209,7 @@ class FilterPipeline:
 
     def add_category_filter(self, categories: list[str]) -> "FilterPipeline":
         """Add category filter."""
+        categories = set(categories)
         def fn(item):
             category = item.metadata.category if item.metadata else None
             return category in categories
@@ -169,8 +218,9 @@ class FilterPipeline:
 
     def add_topic_filter(self, topics: list[str]) -> "FilterPipeline":
         """Add topic filter."""
+        topics = frozenset(topics)
         def fn(item):
-            return any(t in topics for t in item.topics)
+            return not topics.isdisjoint(item.topics)
         self._filters.append(fn)
         return self
 
@@ -178,25 +228,24 @@ class FilterPipeline:
         """Add age filter."""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
         def fn(item):
-            try:
-                item_time = datetime.fromisoformat(
-                    item.published_at.replace('Z', '+00:00')
-                ).replace(tzinfo=None)
-                return item_time >= cutoff
-            except:
-                return True
+            return not _older_than(item, cutoff)
         self._filters.append(fn)
         return self
 
     def add_keyword_filter(self, keywords: list[str], exclude: bool = False) -> "FilterPipeline":
         """Add keyword filter."""
+        matcher = _keyword_matcher(keywords)
         def fn(item):
-            text = f"{item.title} {item.summary}".lower()
-            has_keyword = any(kw.lower() in text for kw in keywords)
+            has_keyword = matcher is not None and matcher.matches(item.search_text)
             return not has_keyword if exclude else has_keyword
         self._filters.append(fn)
         return self
 
+    def add_config_filter(self, config: FilterConfig) -> "FilterPipeline":
+        """Add all filters of a FilterConfig as one compiled predicate."""
+        self._filters.append(config.compile())
+        return self
+
     def add_alert_filter(self) -> "FilterPipeline":
         """Add alert-only filter."""
         def fn(item):
@@ -206,7 +255,6 @@ class FilterPipeline:
 
     def apply(self, items: list[NormalizedNewsItem]) -> list[NormalizedNewsItem]:
         """Apply all filters to items."""
-        result = items
-        for filter_fn in self._filters:
-            result = [item for item in result if filter_fn(item)]
-        return result
+        # One pass over the items; each item stops at its first failing filter
+        filters = tuple(self._filters)
+        return [item for item in items if all(fn(item) for fn in filters)]
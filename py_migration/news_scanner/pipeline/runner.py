@@ -5,6 +5,8 @@ Orchestrates: Fetch -> Parse -> Filter -> Deduplicate -> Store
 """
 
 import time
+import asyncio
+from operator import attrgetter
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -92,44 +94,38 @@ class NewsPipeline:
         # Stage 1: Fetch
         logger.info("Pipeline: Starting fetch stage")
 
+        # Sources are independent, so their requests run concurrently;
+        # results are merged in source order
+        fetches = []
         if self.options.use_gdelt:
-            try:
-                items = await self.gdelt.fetch(categories=self.options.categories)
-                all_items.extend(items)
-                logger.info(f"Pipeline: GDELT fetched {len(items)} items")
-            except Exception as e:
-                errors.append(PipelineError(
-                    stage="fetch",
-                    source="GDELT",
-                    message=str(e),
-                    timestamp=now_iso()
-                ))
-
+            fetches.append(("GDELT", self.gdelt.fetch(categories=self.options.categories)))
         if self.options.use_rss:
-            try:
-                items = await self.rss.fetch(categories=self.options.categories)
-                all_items.extend(items)
-                logger.info(f"Pipeline: RSS fetched {len(items)} items")
-            except Exception as e:
-                errors.append(PipelineError(
-                    stage="fetch",
-                    source="RSS",
-                    message=str(e),
-                    timestamp=now_iso()
-                ))
-
+            fetches.append(("RSS", self.rss.fetch(categories=self.options.categories)))
         if self.options.use_intel:
-            try:
-                items = await self.rss.fetch_intel()
-                all_items.extend(items)
-                logger.info(f"Pipeline: Intel fetched {len(items)} items")
-            except Exception as e:
+            fetches.append(("Intel", self.rss.fetch_intel()))
+
+        try:
+            results = await asyncio.gather(
+                *(fetch for _, fetch in fetches), return_exceptions=True
+            )
+        finally:
+            # Fetches of this run share each connector's session; release
+            # them before the event loop goes away (reopened on the next run)
+            await asyncio.gather(self.gdelt.close(), self.rss.close())
+
+        for (source, _), items in zip(fetches, results):
+            if isinstance(items, BaseException):
+                if not isinstance(items, Exception):
+                    raise items  # e.g. cancellation
                 errors.append(PipelineError(
                     stage="fetch",
-                    source="Intel",
-                    message=str(e),
+                    source=source,
+                    message=str(items),
                     timestamp=now_iso()
                 ))
+                continue
+            all_items.extend(items)
+            logger.info(f"Pipeline: {source} fetched {len(items)} items")
 
         fetched_count = len(all_items)
 
@@ -167,10 +163,7 @@ class NewsPipeline:
             logger.info(f"Pipeline: Deduplicated {dedup_count} items")
 
         # Sort by date (newest first)
-        all_items.sort(
-            key=lambda x: x.published_at,
-            reverse=True
-        )
+        all_items.sort(key=attrgetter("published_at"), reverse=True)
 
         # Stage 5: Store
         stored_count = len(all_items)
@@ -6,12 +6,17 @@ Stores news items as newline-delimited JSON.
 
 import os
 import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
 
 from .base import BaseStorage
 from ..models import NormalizedNewsItem
-from ..utils import logger
+from ..utils import logger, json_loads, json_dumps_bytes
+
+
+# Write buffer size; lines are coalesced into blocks of this size
+_WRITE_BUFFER_SIZE = 64 * 1024
 
 
 class JsonlStorage(BaseStorage):
@@ -50,29 +55,39 @@ class JsonlStorage(BaseStorage):
 
     async def save(self, items: list[NormalizedNewsItem]) -> None:
         """Save news items to JSONL file."""
-        mode = "a" if self.append else "w"
+        await asyncio.to_thread(self._save_sync, items)
 
-        with open(self.file_path, mode, encoding="utf-8") as f:
-            for item in items:
-                line = json.dumps(item.to_dict(), ensure_ascii=False)
-                f.write(line + "\n")
+    async def load(self) -> list[NormalizedNewsItem]:
+        """Load news items from JSONL file."""
+        return await asyncio.to_thread(self._load_sync)
+
+    async def clear(self) -> None:
+        """Clear the JSONL file."""
+        await asyncio.to_thread(self._clear_sync)
+
+    def _save_sync(self, items: list[NormalizedNewsItem]) -> None:
+        """Blocking save (run in a worker thread by save)."""
+        mode = "ab" if self.append else "wb"
+
+        with open(self.file_path, mode, buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(json_dumps_bytes(item.to_dict()) + b"\n" for item in items)
 
         logger.info(f"JSONL: Saved {len(items)} items to {self.file_path}")
 
-    async def load(self) -> list[NormalizedNewsItem]:
-        """Load news items from JSONL file."""
+    def _load_sync(self) -> list[NormalizedNewsItem]:
+        """Blocking load (run in a worker thread by load)."""
         if not os.path.exists(self.file_path):
             return []
 
         items = []
 
-        with open(self.file_path, "r", encoding="utf-8") as f:
+        with open(self.file_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
+                    data = json_loads(line)
                     items.append(NormalizedNewsItem.from_dict(data))
                 except json.JSONDecodeError as e:
                     logger.warning(f"JSONL: Failed to parse line: {e}")
@@ -80,8 +95,8 @@ class JsonlStorage(BaseStorage):
         logger.info(f"JSONL: Loaded {len(items)} items from {self.file_path}")
         return items
 
-    async def clear(self) -> None:
-        """Clear the JSONL file."""
+    def _clear_sync(self) -> None:
+        """Blocking clear (run in a worker thread by clear)."""
         if os.path.exists(self.file_path):
             os.remove(self.file_path)
             logger.info(f"JSONL: Cleared {self.file_path}")
@@ -93,10 +108,8 @@ class JsonlStorage(BaseStorage):
     # Sync versions for convenience
     def save_sync(self, items: list[NormalizedNewsItem]) -> None:
         """Synchronous save."""
-        import asyncio
-        asyncio.get_event_loop().run_until_complete(self.save(items))
+        self._save_sync(items)
 
     def load_sync(self) -> list[NormalizedNewsItem]:
         """Synchronous load."""
-        import asyncio
-        return asyncio.get_event_loop().run_until_complete(self.load())
+        return self._load_sync()
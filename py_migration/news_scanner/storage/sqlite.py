@@ -6,13 +6,15 @@ Stores news items in a SQLite database.
 
 import os
 import json
+import asyncio
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .base import BaseStorage
 from ..models import NormalizedNewsItem, NewsMetadata
-from ..utils import logger
+from ..utils import logger, json_loads
 
 
 CREATE_TABLE_SQL = """
@@ -30,16 +32,81 @@ CREATE TABLE IF NOT EXISTS news_items (
     topics TEXT,
     language TEXT DEFAULT 'en',
     metadata TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_alert INTEGER GENERATED ALWAYS AS (json_extract(metadata, '$.is_alert')) VIRTUAL
+);
+"""
+
+# Adds the generated is_alert column to tables created without it
+ADD_IS_ALERT_SQL = """
+ALTER TABLE news_items ADD COLUMN
+is_alert INTEGER GENERATED ALWAYS AS (json_extract(metadata, '$.is_alert')) VIRTUAL
 """
 
 CREATE_INDICES_SQL = """
 CREATE INDEX IF NOT EXISTS idx_published_at ON news_items(published_at);
 CREATE INDEX IF NOT EXISTS idx_source ON news_items(source);
 CREATE INDEX IF NOT EXISTS idx_created_at ON news_items(created_at);
+CREATE INDEX IF NOT EXISTS idx_is_alert ON news_items(published_at) WHERE is_alert = 1;
+"""
+
+# One row per URL (items without a URL are exempt); makes re-ingesting
+# the same articles idempotent
+CREATE_URL_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_url ON news_items(url) WHERE url != ''
+"""
+
+# Connection tuning for batch ingest: WAL lets readers run alongside the
+# writer, and NORMAL sync only fsyncs at checkpoints (safe with WAL).
+CONNECTION_PRAGMAS_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
 """
 
+INSERT_SQL = """
+INSERT OR IGNORE INTO news_items
+(id, source, url, title, published_at, fetched_at, authors, summary,
+ content_text, tickers, topics, language, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Like INSERT_SQL, but a repeated URL keeps the longest content_text
+# (multiple ON CONFLICT clauses need SQLite 3.35+)
+INSERT_KEEP_LONGEST_SQL = """
+INSERT INTO news_items
+(id, source, url, title, published_at, fetched_at, authors, summary,
+ content_text, tickers, topics, language, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) WHERE url != '' DO UPDATE SET content_text = excluded.content_text
+    WHERE length(excluded.content_text) > length(news_items.content_text)
+ON CONFLICT DO NOTHING
+"""
+
+
+# Rows fetched per lock acquisition by iter_load
+_FETCH_BATCH_SIZE = 256
+
+
+def _item_row(item: NormalizedNewsItem) -> tuple:
+    """Column values for INSERT_SQL."""
+    return (
+        item.id,
+        item.source,
+        item.url,
+        item.title,
+        item.published_at,
+        item.fetched_at,
+        json.dumps(item.authors),
+        item.summary,
+        item.content_text,
+        json.dumps(item.tickers),
+        json.dumps(item.topics),
+        item.language,
+        json.dumps(item.metadata.to_dict() if item.metadata else {}),
+    )
+
 
 class SqliteStorage(BaseStorage):
     """
@@ -55,15 +122,26 @@ class SqliteStorage(BaseStorage):
         count = storage.count()
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, keep_longest: bool = False):
         """
         Initialize SQLite storage.
 
+        Items whose ID or URL is already stored are skipped.
+
         Args:
             db_path: Path to SQLite database file.
+            keep_longest: On a repeated URL, replace the stored content_text
+                when the new one is longer.
         """
         self.db_path = db_path
+        self.keep_longest = keep_longest
         self._conn: Optional[sqlite3.Connection] = None
+        # False when legacy duplicate URLs prevented creating idx_url
+        self._has_url_index = True
+        # save/load/clear run in worker threads while the synchronous
+        # methods may run in others; every use of the shared connection
+        # holds this lock
+        self._lock = threading.Lock()
 
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -74,68 +152,109 @@ class SqliteStorage(BaseStorage):
     def _init_db(self) -> None:
         """Initialize database tables."""
         conn = self._get_conn()
-        conn.executescript(CREATE_TABLE_SQL + CREATE_INDICES_SQL)
+        conn.executescript(CREATE_TABLE_SQL)
+        # Generated columns are only listed by table_xinfo
+        columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(news_items)")}
+        if "is_alert" not in columns:
+            conn.execute(ADD_IS_ALERT_SQL)
+        conn.executescript(CREATE_INDICES_SQL)
+        try:
+            conn.execute(CREATE_URL_INDEX_SQL)
+        except sqlite3.IntegrityError:
+            self._has_url_index = False
+            logger.warning(
+                f"SQLite: Duplicate URLs in {self.db_path}, items are only deduplicated by ID"
+            )
         conn.commit()
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(CONNECTION_PRAGMAS_SQL)
         return self._conn
 
     async def save(self, items: list[NormalizedNewsItem]) -> None:
         """Save news items to database."""
-        conn = self._get_conn()
+        await asyncio.to_thread(self._save_sync, items)
 
-        insert_sql = """
-        INSERT OR REPLACE INTO news_items
-        (id, source, url, title, published_at, fetched_at, authors, summary,
-         content_text, tickers, topics, language, metadata)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+    async def load(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> list[NormalizedNewsItem]:
+        """Load news items from database, newest first."""
+        return await asyncio.to_thread(self._load_sync, limit, offset)
 
-        for item in items:
-            conn.execute(insert_sql, (
-                item.id,
-                item.source,
-                item.url,
-                item.title,
-                item.published_at,
-                item.fetched_at,
-                json.dumps(item.authors),
-                item.summary,
-                item.content_text,
-                json.dumps(item.tickers),
-                json.dumps(item.topics),
-                item.language,
-                json.dumps(item.metadata.to_dict() if item.metadata else {}),
-            ))
+    async def clear(self) -> None:
+        """Clear all items from database."""
+        await asyncio.to_thread(self._clear_sync)
 
-        conn.commit()
-        logger.info(f"SQLite: Saved {len(items)} items to {self.db_path}")
+    def _save_sync(self, items: list[NormalizedNewsItem]) -> None:
+        """Blocking save (run in a worker thread by save)."""
+        # ON CONFLICT(url) needs idx_url to exist
+        keep_longest = self.keep_longest and self._has_url_index
+        insert_sql = INSERT_KEEP_LONGEST_SQL if keep_longest else INSERT_SQL
 
-    async def load(self) -> list[NormalizedNewsItem]:
-        """Load all news items from database."""
-        conn = self._get_conn()
-        cursor = conn.execute(
-            "SELECT * FROM news_items ORDER BY published_at DESC"
-        )
+        # One prepared statement and one transaction for the whole batch
+        with self._lock, self._get_conn() as conn:
+            before = conn.total_changes
+            conn.executemany(insert_sql, map(_item_row, items))
+            # Rows inserted or updated; skipped duplicates are not counted
+            saved = conn.total_changes - before
+
+        logger.info(f"SQLite: Saved {saved} of {len(items)} items to {self.db_path}")
 
-        items = []
-        for row in cursor:
-            items.append(self._row_to_item(row))
+    def _load_sync(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> list[NormalizedNewsItem]:
+        """Blocking load (run in a worker thread by load)."""
+        items = list(self.iter_load(limit, offset))
 
         logger.info(f"SQLite: Loaded {len(items)} items from {self.db_path}")
         return items
 
-    async def clear(self) -> None:
-        """Clear all items from database."""
-        conn = self._get_conn()
-        conn.execute("DELETE FROM news_items")
-        conn.commit()
+    def _clear_sync(self) -> None:
+        """Blocking clear (run in a worker thread by clear)."""
+        with self._lock, self._get_conn() as conn:
+            conn.execute("DELETE FROM news_items")
         logger.info(f"SQLite: Cleared {self.db_path}")
 
+    def iter_load(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Iterator[NormalizedNewsItem]:
+        """
+        Lazily yield items, newest first.
+
+        Rows are only decoded as they are consumed, so callers that stop
+        early (or page with limit/offset) skip the JSON parsing of the rest.
+
+        Args:
+            limit: Max items to yield (None for all).
+            offset: Number of newest items to skip.
+
+        Yields:
+            News items.
+        """
+        # Rows are fetched in batches under the lock, which is released
+        # while the consumer works, so saves aren't blocked by a slow reader
+        with self._lock:
+            cursor = self._get_conn().execute(
+                "SELECT * FROM news_items ORDER BY published_at DESC LIMIT ? OFFSET ?",
+                [-1 if limit is None else limit, offset]
+            )
+            rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        while rows:
+            for row in rows:
+                yield self._row_to_item(row)
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+
     def query(
         self,
         where_clause: str,
@@ -153,26 +272,27 @@ class SqliteStorage(BaseStorage):
         Returns:
             List of matching items.
         """
-        conn = self._get_conn()
-
         sql = f"SELECT * FROM news_items WHERE {where_clause} ORDER BY published_at DESC"
         if limit:
             sql += f" LIMIT {limit}"
 
-        cursor = conn.execute(sql, params or [])
-        return [self._row_to_item(row) for row in cursor]
+        with self._lock:
+            rows = self._get_conn().execute(sql, params or []).fetchall()
+        return [self._row_to_item(row) for row in rows]
 
     def count(self) -> int:
         """Get count of items in database."""
-        conn = self._get_conn()
-        cursor = conn.execute("SELECT COUNT(*) FROM news_items")
-        return cursor.fetchone()[0]
+        with self._lock:
+            cursor = self._get_conn().execute("SELECT COUNT(*) FROM news_items")
+            return cursor.fetchone()[0]
 
     def get_sources(self) -> list[str]:
         """Get list of unique sources."""
-        conn = self._get_conn()
-        cursor = conn.execute("SELECT DISTINCT source FROM news_items ORDER BY source")
-        return [row[0] for row in cursor]
+        with self._lock:
+            cursor = self._get_conn().execute(
+                "SELECT DISTINCT source FROM news_items ORDER BY source"
+            )
+            return [row[0] for row in cursor]
 
     def get_by_source(self, source: str, limit: int = 100) -> list[NormalizedNewsItem]:
         """Get items by source."""
@@ -180,20 +300,21 @@ class SqliteStorage(BaseStorage):
 
     def get_alerts(self, limit: int = 100) -> list[NormalizedNewsItem]:
         """Get alert items."""
-        conn = self._get_conn()
-        cursor = conn.execute("""
-            SELECT * FROM news_items
-            WHERE json_extract(metadata, '$.is_alert') = 1
-            ORDER BY published_at DESC
-            LIMIT ?
-        """, [limit])
-        return [self._row_to_item(row) for row in cursor]
+        with self._lock:
+            rows = self._get_conn().execute("""
+                SELECT * FROM news_items
+                WHERE is_alert = 1
+                ORDER BY published_at DESC
+                LIMIT ?
+            """, [limit]).fetchall()
+        return [self._row_to_item(row) for row in rows]
 
     def close(self) -> None:
         """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
 
     def get_path(self) -> str:
         """Get database path."""
@@ -201,7 +322,7 @@ class SqliteStorage(BaseStorage):
 
     def _row_to_item(self, row: sqlite3.Row) -> NormalizedNewsItem:
         """Convert database row to NormalizedNewsItem."""
-        metadata_dict = json.loads(row["metadata"] or "{}")
+        metadata_dict = json_loads(row["metadata"] or "{}")
 
         return NormalizedNewsItem(
             id=row["id"],
@@ -210,11 +331,11 @@ class SqliteStorage(BaseStorage):
             title=row["title"],
             published_at=row["published_at"],
             fetched_at=row["fetched_at"],
-            authors=json.loads(row["authors"] or "[]"),
+            authors=json_loads(row["authors"] or "[]"),
             summary=row["summary"] or "",
             content_text=row["content_text"] or "",
-            tickers=json.loads(row["tickers"] or "[]"),
-            topics=json.loads(row["topics"] or "[]"),
+            tickers=json_loads(row["tickers"] or "[]"),
+            topics=json_loads(row["topics"] or "[]"),
             language=row["language"] or "en",
             metadata=NewsMetadata(**metadata_dict),
         )
@@ -4,10 +4,13 @@ from .config import config, Config
 from .helpers import (
     hash_code,
     generate_id,
+    json_loads,
+    json_dumps_bytes,
     parse_gdelt_date,
     parse_rss_date,
     now_iso,
     strip_html,
+    last_sentence_end,
     truncate,
     extract_domain,
 )
@@ -18,10 +21,13 @@ __all__ = [
     "Config",
     "hash_code",
     "generate_id",
+    "json_loads",
+    "json_dumps_bytes",
     "parse_gdelt_date",
     "parse_rss_date",
     "now_iso",
     "strip_html",
+    "last_sentence_end",
     "truncate",
     "extract_domain",
     "logger",
@@ -6,14 +6,20 @@ All configuration is loaded from environment variables with sensible defaults.
 
 import os
 from dataclasses import dataclass, field
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping
 
-from ..models import FeedSource, IntelSource
+from ..models import FeedSource, IntelSource, _SLOTS
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Config:
-    """Main configuration object."""
+    """
+    Main configuration object.
+
+    Immutable: build a new instance (e.g. with dataclasses.replace)
+    instead of assigning to fields.
+    """
 
     # Debug mode
     debug: bool = False
@@ -35,7 +41,7 @@ class Config:
 
     # Request settings
     request_timeout: int = 15
-    delay_between_requests: float = 0.5
+    max_concurrent: int = 4  # Parallel requests per connector fetch
 
     # Cache settings (seconds)
     cache_ttl_news: int = 300
@@ -44,6 +50,12 @@ class Config:
     # Output settings
     output_dir: str = "./output"
 
+    def __post_init__(self):
+        # Connectors bound their requests with Semaphore(max_concurrent);
+        # below 1 every fetch would wait forever
+        if self.max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {self.max_concurrent}")
+
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
@@ -58,7 +70,7 @@ class Config:
                 ] if p
             ],
             request_timeout=int(os.getenv("REQUEST_TIMEOUT", "15")),
-            delay_between_requests=float(os.getenv("DELAY_BETWEEN_REQUESTS", "0.5")),
+            max_concurrent=int(os.getenv("MAX_CONCURRENT", "4")),
             cache_ttl_news=int(os.getenv("CACHE_TTL_NEWS", "300")),
             cache_ttl_markets=int(os.getenv("CACHE_TTL_MARKETS", "60")),
             output_dir=os.getenv("OUTPUT_DIR", "./output"),
@@ -73,41 +85,42 @@ config = Config.from_env()
 # Feed Sources
 # =============================================================================
 
-FEEDS: dict[str, list[FeedSource]] = {
-    "politics": [
+# Read-only after import: tuples per category behind a read-only mapping
+FEEDS: Mapping[str, tuple[FeedSource, ...]] = MappingProxyType({
+    "politics": (
         FeedSource("BBC World", "https://feeds.bbci.co.uk/news/world/rss.xml", "politics"),
         FeedSource("NPR News", "https://feeds.npr.org/1001/rss.xml", "politics"),
         FeedSource("Guardian World", "https://www.theguardian.com/world/rss", "politics"),
         FeedSource("NYT World", "https://rss.nytimes.com/services/xml/rss/nyt/World.xml", "politics"),
-    ],
-    "tech": [
+    ),
+    "tech": (
         FeedSource("Hacker News", "https://hnrss.org/frontpage", "tech"),
         FeedSource("Ars Technica", "https://feeds.arstechnica.com/arstechnica/technology-lab", "tech"),
         FeedSource("The Verge", "https://www.theverge.com/rss/index.xml", "tech"),
         FeedSource("MIT Tech Review", "https://www.technologyreview.com/feed/", "tech"),
-    ],
-    "finance": [
+    ),
+    "finance": (
         FeedSource("CNBC", "https://www.cnbc.com/id/100003114/device/rss/rss.html", "finance"),
         FeedSource("MarketWatch", "https://feeds.marketwatch.com/marketwatch/topstories", "finance"),
         FeedSource("Yahoo Finance", "https://finance.yahoo.com/news/rssindex", "finance"),
         FeedSource("BBC Business", "https://feeds.bbci.co.uk/news/business/rss.xml", "finance"),
-    ],
-    "gov": [
+    ),
+    "gov": (
         FeedSource("White House", "https://www.whitehouse.gov/news/feed/", "gov"),
         FeedSource("Federal Reserve", "https://www.federalreserve.gov/feeds/press_all.xml", "gov"),
         FeedSource("SEC Announcements", "https://www.sec.gov/news/pressreleases.rss", "gov"),
-    ],
-    "ai": [
+    ),
+    "ai": (
         FeedSource("OpenAI Blog", "https://openai.com/news/rss.xml", "ai"),
         FeedSource("ArXiv AI", "https://rss.arxiv.org/rss/cs.AI", "ai"),
-    ],
-    "intel": [
+    ),
+    "intel": (
         FeedSource("CSIS", "https://www.csis.org/analysis/feed", "intel"),
         FeedSource("Brookings", "https://www.brookings.edu/feed/", "intel"),
-    ],
-}
+    ),
+})
 
-INTEL_SOURCES: list[IntelSource] = [
+INTEL_SOURCES: tuple[IntelSource, ...] = (
     IntelSource("CSIS", "https://www.csis.org/analysis/feed", "intel", "think-tank", ["defense", "geopolitics"]),
     IntelSource("Brookings", "https://www.brookings.edu/feed/", "intel", "think-tank", ["policy", "geopolitics"]),
     IntelSource("CFR", "https://www.cfr.org/rss.xml", "intel", "think-tank", ["foreign-policy"]),
@@ -119,14 +132,14 @@ INTEL_SOURCES: list[IntelSource] = [
     IntelSource("Bellingcat", "https://www.bellingcat.com/feed/", "intel", "osint", ["investigation", "osint"]),
     IntelSource("CISA Alerts", "https://www.cisa.gov/uscert/ncas/alerts.xml", "intel", "cyber", ["cyber", "security"]),
     IntelSource("Krebs Security", "https://krebsonsecurity.com/feed/", "intel", "cyber", ["cyber", "security"]),
-]
+)
 
 # GDELT query templates by category
-GDELT_QUERIES: dict[str, str] = {
+GDELT_QUERIES: Mapping[str, str] = MappingProxyType({
     "politics": "(politics OR government OR election OR congress)",
     "tech": "(technology OR software OR startup OR AI)",
     "finance": '(finance OR "stock market" OR economy OR banking)',
     "gov": '("federal government" OR "white house" OR congress OR regulation)',
     "ai": '("artificial intelligence" OR "machine learning" OR AI OR ChatGPT)',
     "intel": "(intelligence OR security OR military OR defense)",
-}
+})
@@ -3,43 +3,158 @@ Utility helper functions.
 """
 
 import re
+import json
 import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional, Union
 from urllib.parse import urlparse
 from html import unescape
 
+try:
+    import orjson
+except ImportError:  # Optional dependency: orjson
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # Optional dependency: google-re2
+    re2 = None
+
+# Engine for the simple, backtracking-free patterns: RE2 when installed
+# (linear-time DFA), otherwise the stdlib. Patterns relying on Unicode
+# character classes (\s, \d) or flags stay on `re`, since RE2's classes
+# are ASCII-only.
+_fast_re = re2 if re2 is not None else re
+
 
 def hash_code(s: str) -> str:
-    """Generate a stable hash from a string."""
-    return hashlib.md5(s.encode()).hexdigest()[:12]
+    """Generate a stable hash from a string (not cryptographic)."""
+    # MD5 keeps IDs identical to those already stored and deduplicated
+    return hashlib.md5(s.encode(), usedforsecurity=False).hexdigest()[:12]
+
 
+# Source names repeat for every item of a feed/category
+_source_hash = lru_cache(maxsize=1024)(hash_code)
 
+
+# Scheduled runs refetch mostly the same articles, so IDs repeat across cycles
+@lru_cache(maxsize=8192)
 def generate_id(url: str, source: str) -> str:
     """Generate a unique ID from URL and source."""
     url_hash = hash_code(url)
-    source_hash = hash_code(source)
+    source_hash = _source_hash(source)
     return f"{source_hash}-{url_hash}"
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes (uses orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (uses orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Same compact output as orjson
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Articles of one poll share few distinct seendates (they cluster by minute)
+@lru_cache(maxsize=4096)
+def _parse_gdelt_date_fast(date_str: str) -> Optional[str]:
+    """ISO8601 for the GDELT format 20251202T224500Z, or None for other shapes."""
+    # Fixed width, so sliced directly
+    if (
+        len(date_str) == 16 and date_str[8] == 'T' and date_str[15] == 'Z'
+        and date_str[:8].isdecimal() and date_str[9:15].isdecimal()
+    ):
+        d = date_str
+        return f"{d[0:4]}-{d[4:6]}-{d[6:8]}T{d[9:11]}:{d[11:13]}:{d[13:15]}Z"
+    return None
+
+
 def parse_gdelt_date(date_str: str) -> str:
     """
     Parse GDELT date format (20251202T224500Z) to ISO8601.
     """
     if not date_str:
-        return datetime.utcnow().isoformat() + "Z"
+        return now_iso()
 
-    # Try GDELT format: 20251202T224500Z
-    match = re.match(r'^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z$', date_str)
-    if match:
-        year, month, day, hour, minute, sec = match.groups()
-        return f"{year}-{month}-{day}T{hour}:{minute}:{sec}Z"
+    parsed = _parse_gdelt_date_fast(date_str)
+    if parsed is not None:
+        return parsed
 
     # Try standard parsing
     try:
         dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
         return dt.isoformat().replace('+00:00', 'Z')
     except ValueError:
-        return datetime.utcnow().isoformat() + "Z"
+        return now_iso()
+
+
+# Fast paths for the usual RSS/Atom date shapes; anything else goes
+# through the strptime formats below
+_RFC2822_DATE_RE = re.compile(
+    r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d{1,2}) '
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{4}) '
+    r'(\d{2}):(\d{2}):(\d{2}) (?:([+-])(\d{2})(\d{2})|GMT|UTC)$'
+)
+_ISO_DATE_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})'
+    r'(?:Z|([+-])(\d{2}):?(\d{2}))$'
+)
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+_RSS_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %z",      # RFC 2822
+    "%a, %d %b %Y %H:%M:%S %Z",       # RFC 2822 with timezone name
+    "%Y-%m-%dT%H:%M:%S%z",            # ISO 8601
+    "%Y-%m-%dT%H:%M:%SZ",             # ISO 8601 UTC
+    "%Y-%m-%d %H:%M:%S",              # Simple datetime
+    "%Y-%m-%d",                        # Date only
+)
+
+
+def _tz_offset(sign: str, hours: str, minutes: str) -> timezone:
+    """Fixed-offset timezone from a +HHMM / -HH:MM offset."""
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == '-' else offset)
+
+
+def _parse_rss_date_fast(date_str: str) -> Optional[str]:
+    """
+    Parse the common RFC 2822 / ISO 8601 shapes without strptime.
+
+    Produces the same string the matching strptime format would, or None
+    when the date needs the general formats.
+    """
+    match = _ISO_DATE_RE.match(date_str)
+    if match:
+        year, month, day, hour, minute, sec, sign, off_h, off_m = match.groups()
+        month = int(month)
+        utc = timezone.utc
+    else:
+        match = _RFC2822_DATE_RE.match(date_str)
+        if not match:
+            return None
+        day, month, year, hour, minute, sec, sign, off_h, off_m = match.groups()
+        month = _MONTHS[month]
+        utc = None  # GMT/UTC names (%Z) yield a naive datetime
+
+    try:
+        tz = utc if sign is None else _tz_offset(sign, off_h, off_m)
+        dt = datetime(
+            int(year), month, int(day), int(hour), int(minute), int(sec), tzinfo=tz
+        )
+    except ValueError:
+        return None
+    return dt.isoformat().replace('+00:00', 'Z')
 
 
 def parse_rss_date(date_str: str) -> str:
@@ -47,27 +162,23 @@ def parse_rss_date(date_str: str) -> str:
     Parse various RSS date formats to ISO8601.
     """
     if not date_str:
-        return datetime.utcnow().isoformat() + "Z"
+        return now_iso()
+
+    date_str = date_str.strip()
+    parsed = _parse_rss_date_fast(date_str)
+    if parsed is not None:
+        return parsed
 
     # Common RSS date formats
-    formats = [
-        "%a, %d %b %Y %H:%M:%S %z",      # RFC 2822
-        "%a, %d %b %Y %H:%M:%S %Z",       # RFC 2822 with timezone name
-        "%Y-%m-%dT%H:%M:%S%z",            # ISO 8601
-        "%Y-%m-%dT%H:%M:%SZ",             # ISO 8601 UTC
-        "%Y-%m-%d %H:%M:%S",              # Simple datetime
-        "%Y-%m-%d",                        # Date only
-    ]
-
-    for fmt in formats:
+    for fmt in _RSS_DATE_FORMATS:
         try:
-            dt = datetime.strptime(date_str.strip(), fmt)
+            dt = datetime.strptime(date_str, fmt)
             return dt.isoformat().replace('+00:00', 'Z')
         except ValueError:
             continue
 
     # Fallback
-    return datetime.utcnow().isoformat() + "Z"
+    return now_iso()
 
 
 def now_iso() -> str:
@@ -75,6 +186,17 @@ def now_iso() -> str:
     return datetime.utcnow().isoformat() + "Z"
 
 
+# strip_html patterns (compiled once; called for several fields per item)
+_TAG_RE = _fast_re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ELLIPSIS_RE = _fast_re.compile(r'\[(?:…|\.\.\.)\]')
+# Trailing "Continue reading..." and/or "Read more..." (in that order)
+_READ_MORE_RE = re.compile(
+    r'(?:Read more\.\.\.?)?Continue reading\.\.\.?$|Read more\.\.\.?$',
+    re.IGNORECASE,
+)
+
+
 def strip_html(html: str) -> str:
     """
     Remove HTML tags and decode entities.
@@ -83,23 +205,30 @@ def strip_html(html: str) -> str:
         return ""
 
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html)
+    text = _TAG_RE.sub(' ', html) if '<' in html else html
 
     # Decode HTML entities
     text = unescape(text)
 
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
 
     # Remove common RSS artifacts
-    text = re.sub(r'\[…\]', '...', text)
-    text = re.sub(r'\[\.\.\.\]', '...', text)
-    text = re.sub(r'Continue reading\.\.\.?$', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'Read more\.\.\.?$', '', text, flags=re.IGNORECASE)
+    if '[' in text:
+        text = _ELLIPSIS_RE.sub('...', text)
+    if text.endswith('..'):
+        text = _READ_MORE_RE.sub('', text)
 
     return text.strip()
 
 
+def last_sentence_end(text: str) -> int:
+    """
+    Index of the last sentence ending ('.', '?' or '!') in text, -1 if none.
+    """
+    return max(text.rfind('.'), text.rfind('?'), text.rfind('!'))
+
+
 def truncate(text: str, max_length: int = 300) -> str:
     """
     Truncate text to max length, preferring sentence boundaries.
@@ -110,11 +239,7 @@ def truncate(text: str, max_length: int = 300) -> str:
     truncated = text[:max_length]
 
     # Try to break at sentence boundary
-    last_period = truncated.rfind('.')
-    last_question = truncated.rfind('?')
-    last_exclaim = truncated.rfind('!')
-
-    boundary = max(last_period, last_question, last_exclaim)
+    boundary = last_sentence_end(truncated)
 
     if boundary > max_length * 0.5:
         return text[:boundary + 1]
@@ -127,8 +252,17 @@ def truncate(text: str, max_length: int = 300) -> str:
     return truncated + "..."
 
 
+# scheme://netloc for plain ASCII URLs; anything unusual goes through urlparse
+_URL_NETLOC_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*://([^/?#\[\]\s]*)(?:[/?#]|$)')
+
+
 def extract_domain(url: str) -> str:
     """Extract domain from URL."""
+    match = _URL_NETLOC_RE.match(url) if isinstance(url, str) and url.isascii() else None
+    if match:
+        domain = match.group(1)
+        return domain[4:] if domain.startswith('www.') else domain
+
     try:
         parsed = urlparse(url)
         domain = parsed.netloc
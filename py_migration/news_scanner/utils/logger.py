@@ -7,8 +7,21 @@ import sys
 from typing import Optional
 
 
+# Shared by every Logger's handler
+_FORMATTER = logging.Formatter(
+    '%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+
 class Logger:
-    """Simple logger wrapper."""
+    """
+    Simple logger wrapper.
+
+    Pass message arguments separately so formatting only happens when the
+    level is enabled:
+        logger.debug("Fetching %s: %s", name, url)
+    """
 
     def __init__(self, name: str = "news_scanner", level: int = logging.INFO):
         self._logger = logging.getLogger(name)
@@ -17,11 +30,7 @@ class Logger:
         if not self._logger.handlers:
             handler = logging.StreamHandler(sys.stdout)
             handler.setLevel(level)
-            formatter = logging.Formatter(
-                '%(asctime)s [%(levelname)s] %(message)s',
-                datefmt='%H:%M:%S'
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_FORMATTER)
             self._logger.addHandler(handler)
 
     def debug(self, msg: str, *args):
@@ -26,6 +26,11 @@ from news_scanner import (
 from news_scanner.pipeline import PipelineOptions, FilterConfig
 from news_scanner.utils import logger
 
+try:
+    import uvloop
+except ImportError:  # Optional dependency: uvloop (not available on Windows)
+    uvloop = None
+
 
 def print_results(result: PipelineResult, storage_path: str):
     """Print pipeline results."""
@@ -54,7 +59,9 @@ def print_results(result: PipelineResult, storage_path: str):
 
     for item in result.items[:5]:
         print()
-        title = item.title[:70] + "..." if len(item.title) > 70 else item.title
+        title = item.title
+        if len(title) > 70:
+            title = title[:70] + "..."
         print(f"Title:     {title}")
         print(f"Source:    {item.source}")
         print(f"Published: {item.published_at}")
@@ -68,25 +75,31 @@ def print_results(result: PipelineResult, storage_path: str):
     print(f"Output saved to: {storage_path}")
     print()
 
-    # Alerts
-    alerts = [item for item in result.items if item.metadata.is_alert]
+    # Alerts and topic/source distributions, gathered in one pass
+    alerts = []
+    topic_counts = Counter()
+    source_counts = Counter()
+    for item in result.items:
+        source_counts[item.source] += 1
+        topic_counts.update(item.topics)
+        if item.metadata.is_alert:
+            alerts.append(item)
+
     if alerts:
         print("=" * 60)
         print(f"ALERTS ({len(alerts)} items)")
         print("=" * 60)
         for alert in alerts[:10]:
             kw = alert.metadata.alert_keyword.upper() if alert.metadata.alert_keyword else "?"
-            print(f"[{kw}] {alert.title[:55]}...")
+            title = alert.title
+            if len(title) > 55:
+                title = title[:55] + "..."
+            print(f"[{kw}] {title}")
         if len(alerts) > 10:
             print(f"... and {len(alerts) - 10} more alerts")
         print()
 
     # Topic distribution
-    topic_counts = Counter()
-    for item in result.items:
-        for topic in item.topics:
-            topic_counts[topic] += 1
-
     if topic_counts:
         print("Topic Distribution:")
         for topic, count in topic_counts.most_common():
@@ -95,7 +108,6 @@ def print_results(result: PipelineResult, storage_path: str):
         print()
 
     # Source distribution
-    source_counts = Counter(item.source for item in result.items)
     print("Source Distribution (top 10):")
     for source, count in source_counts.most_common(10):
         print(f"  {source:<25} {count}")
@@ -190,4 +202,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop when installed (cheaper per-await scheduling
+    # for the concurrent fetches), otherwise asyncio's default loop
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -2,6 +2,9 @@
 Tests for analytics modules.
 """
 
+import random
+import re
+
 import pytest
 from news_scanner.analytics import (
     TopicDetector,
@@ -11,7 +14,11 @@ from news_scanner.analytics import (
     Deduplicator,
     SentimentAnalyzer,
 )
-from news_scanner.analytics.alerts import Sentiment
+from news_scanner.analytics.dedup import SlidingWindowDeduplicator
+from news_scanner.analytics.sentiment import Sentiment
+from news_scanner.analytics.tickers import KNOWN_CRYPTO, KNOWN_INDICES, EXCLUDED_WORDS
+from news_scanner.analytics import matcher as matcher_module
+from news_scanner.analytics.matcher import KeywordMatcher
 from news_scanner.models import NormalizedNewsItem, NewsMetadata
 
 
@@ -43,6 +50,11 @@ class TestTopicDetector:
         assert "CRYPTO" in scores
         assert scores["CRYPTO"] >= 3
 
+    def test_shared_keyword_topics_in_order(self):
+        detector = TopicDetector()
+        assert detector.detect("Chipmaker files for IPO") == ["FINANCE", "TECH"]
+        assert detector.detect_with_scores("IPO after IPO") == {"FINANCE": 2, "TECH": 2}
+
     def test_add_topic(self):
         detector = TopicDetector()
         detector.add_topic("BIOTECH", ["gene", "therapy"])
@@ -50,6 +62,31 @@ class TestTopicDetector:
         assert "BIOTECH" in topics
 
 
+class TestKeywordMatcher:
+    def test_overlapping_keywords(self):
+        matcher = KeywordMatcher([("war", "high"), ("war declared", "critical")])
+        assert sorted(matcher.iter("war declared")) == ["critical", "high"]
+
+    def test_repeated_keyword_values(self):
+        matcher = KeywordMatcher([("russia", "EUROPE"), ("russia", "RUSSIA_CIS")])
+        assert sorted(matcher.iter("sanctions on russia")) == ["EUROPE", "RUSSIA_CIS"]
+
+    def test_no_keywords(self):
+        matcher = KeywordMatcher([])
+        assert list(matcher.iter("anything")) == []
+        assert matcher.matches("anything") is False
+
+    def test_matches(self):
+        matcher = KeywordMatcher([("bitcoin", "bitcoin"), ("ether", "ether")])
+        assert matcher.matches("ethereum rallies") is True
+        assert matcher.matches("stocks rally") is False
+
+    def test_pure_python_fallback(self, monkeypatch):
+        monkeypatch.setattr(matcher_module, "ahocorasick", None)
+        matcher = KeywordMatcher([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+        assert sorted(matcher.iter("ushers")) == [1, 2, 4]
+
+
 class TestAlertDetector:
     def test_detect_alert(self):
         detector = AlertDetector()
@@ -77,6 +114,18 @@ class TestAlertDetector:
         keywords = [r.keyword for r in results]
         assert "military" in keywords or "troops" in keywords
 
+    def test_detect_prefers_highest_severity(self):
+        detector = AlertDetector()
+        result = detector.detect("Troops mass as war declared")
+        assert result.keyword == "war declared"
+        assert result.severity == "critical"
+
+    def test_remove_keyword(self):
+        detector = AlertDetector()
+        detector.remove_keyword("missile")
+        result = detector.detect("Russia launches missile strike")
+        assert result.keyword == "strike"
+
     def test_custom_keywords(self):
         detector = AlertDetector(keywords={"custom_alert": "high"})
         result = detector.detect("This is a custom_alert test")
@@ -104,6 +153,12 @@ class TestTickerExtractor:
         assert "AI" not in tickers
         assert "IT" not in tickers
 
+    def test_add_crypto_keeps_defaults(self):
+        extractor = TickerExtractor()
+        extractor.add_crypto("pepe")
+        assert "PEPE" in extractor.extract("PEPE rallies")
+        assert "PEPE" not in TickerExtractor().extract("PEPE rallies")
+
     def test_extract_with_types(self):
         extractor = TickerExtractor()
         matches = extractor.extract_with_types("$AAPL up, BTC surging")
@@ -112,6 +167,54 @@ class TestTickerExtractor:
         assert types["AAPL"] == "stock"
         assert types["BTC"] == "crypto"
 
+    def test_overlapping_styles(self):
+        extractor = TickerExtractor()
+        assert extractor.extract("$ETH Inc stock") == ["ETH"]
+        assert extractor.extract("$MSFT shares (MSFT)") == ["MSFT"]
+
+    def test_matches_separate_scans(self):
+        """Differential test against one finditer per ticker style."""
+        reference = [
+            (re.compile(r'\$([A-Z]{1,5})\b'), "stock"),
+            (re.compile(r'\b([A-Z]{2,5})\s+(?:stock|shares|inc|corp|ltd)', re.IGNORECASE), "stock"),
+            (re.compile(r'\b(' + '|'.join(KNOWN_CRYPTO) + r')\b'), "crypto"),
+            (re.compile(r'\(([A-Z]{2,5})\)'), "stock"),
+        ]
+
+        def reference_extract_with_types(text):
+            matches, seen = [], set()
+            for pattern, default_type in reference:
+                for match in pattern.finditer(text):
+                    symbol = match.group(1).upper()
+                    if symbol in EXCLUDED_WORDS or symbol in seen:
+                        continue
+                    seen.add(symbol)
+                    if symbol in KNOWN_CRYPTO:
+                        ticker_type = "crypto"
+                    elif symbol in KNOWN_INDICES:
+                        ticker_type = "index"
+                    else:
+                        ticker_type = default_type
+                    context = text[max(0, match.start() - 20):match.end() + 20].strip()
+                    matches.append((symbol, ticker_type, context))
+            return matches
+
+        words = [
+            "$AAPL", "$ETH", "$eth", "AAPL", "ETH", "btc", "Inc", "inc", "corp",
+            "Corp", "stock", "shares", "Ltd", "(NVDA)", "(SPX)", "(ai)", "The",
+            "CEO", "SEC", "rally", "and", "of", "$", "(", ")", "VIX", "SOL", "é",
+        ]
+        rng = random.Random(0)
+        extractor = TickerExtractor()
+        for _ in range(2000):
+            text = rng.choice(["", " "]).join(
+                rng.choice(words) for _ in range(rng.randint(1, 10))
+            )
+            expected = reference_extract_with_types(text)
+            got = extractor.extract_with_types(text)
+            assert [(m.symbol, m.ticker_type, m.context) for m in got] == expected, text
+            assert extractor.extract(text) == sorted(s for s, _, _ in expected), text
+
 
 class TestRegionDetector:
     def test_detect_region(self):
@@ -136,6 +239,18 @@ class TestRegionDetector:
         assert "EUROPE" in results
         assert "nato" in results["EUROPE"] or "eu" in results["EUROPE"]
 
+    def test_keyword_shared_by_regions(self):
+        detector = RegionDetector()
+        results = detector.detect_with_keywords("Kremlin rejects Russia sanctions")
+        assert results["EUROPE"] == ["russia"]
+        assert results["RUSSIA_CIS"] == ["russia", "kremlin"]
+
+    def test_add_region_rebuilds(self):
+        detector = RegionDetector()
+        assert detector.detect("Icebreakers reach Svalbard") is None
+        detector.add_region("ARCTIC", ["arctic", "greenland", "svalbard"])
+        assert detector.detect("Icebreakers reach Svalbard") == "ARCTIC"
+
 
 class TestDeduplicator:
     def create_item(self, id: str, title: str, url: str = "") -> NormalizedNewsItem:
@@ -170,6 +285,27 @@ class TestDeduplicator:
         assert len(result.items) == 2
         assert result.removed_count == 1
 
+    def test_deduplicate_iter(self):
+        dedup = Deduplicator()
+        items = (
+            self.create_item(str(i), "Same Title" if i % 2 else f"Title {i}")
+            for i in range(6)
+        )
+        removed = []
+        unique = dedup.deduplicate_iter(items, removed)
+        assert [item.id for item in unique] == ["0", "1", "2", "4"]
+        assert removed == ["3", "5"]
+
+    def test_sliding_window_evicts_expired(self):
+        dedup = SlidingWindowDeduplicator(window_hours=24)
+        dedup.deduplicate([self.create_item("1", "Old Title")])
+        assert "1" in dedup._seen_cache
+
+        # The 2024 timestamp is outside the window on the next batch
+        dedup.deduplicate([self.create_item("2", "Other Title")])
+        assert "1" not in dedup._seen_cache
+        assert all(item_id in dedup._seen_cache for _, item_id in dedup._seen_heap)
+
     def test_are_duplicates(self):
         dedup = Deduplicator()
         item1 = self.create_item("1", "Same Title")
@@ -179,6 +315,34 @@ class TestDeduplicator:
         item3 = self.create_item("3", "Different Title")
         assert dedup.are_duplicates(item1, item3) is False
 
+    def test_fuzzy_title_match(self):
+        dedup = Deduplicator(title_similarity_threshold=0.6)
+        item1 = self.create_item("1", "Fed raises interest rates again")
+        item2 = self.create_item("2", "Fed raises interest rates")
+        item3 = self.create_item("3", "Fed holds")
+        assert dedup.are_duplicates(item1, item2) is True
+        assert dedup.are_duplicates(item1, item3) is False
+
+    def test_title_tokens_match_word_regex(self):
+        """Test that title tokens are the \\w+ runs of the lowercased title."""
+        from news_scanner.analytics.dedup import _title_tokens
+
+        titles = [
+            "snake_case naming",
+            "«Macron» meets Apple® execs",
+            "Oil at €5 · Gas at $3",
+            "Fed's “surprise” — rates up 0.25%…",
+            "Ünïcödé TITLE, tabs\tand\nnewlines",
+        ]
+        for title in titles:
+            assert _title_tokens(title) == frozenset(re.findall(r'\w+', title.lower())), title
+
+    def test_title_similarity_exact(self):
+        """Test that similarity is exact even when it is below the threshold."""
+        dedup = Deduplicator(title_similarity_threshold=0.9)
+        assert dedup._title_similarity("Fed raises rates", "Fed raises rates again today") == 0.6
+        assert dedup._title_similarity("Fed holds", "Fed raises interest rates again") == 1 / 6
+
 
 class TestSentimentAnalyzer:
     def test_positive_sentiment(self):
@@ -208,3 +372,15 @@ class TestSentimentAnalyzer:
         analyzer = SentimentAnalyzer()
         assert analyzer.is_positive("Strong rally in tech stocks") is True
         assert analyzer.is_positive("Market crashes") is False
+
+    def test_matched_keywords_keep_list_order(self):
+        analyzer = SentimentAnalyzer()
+        result = analyzer.analyze("Strong growth and record high profit")
+        assert result.positive_keywords == ["growth", "profit", "strong", "record high"]
+        assert result.negative_keywords == []
+
+    def test_add_negative(self):
+        analyzer = SentimentAnalyzer()
+        analyzer.add_negative("dump")
+        result = analyzer.analyze("Whales dump tokens")
+        assert result.negative_keywords == ["dump"]
@@ -1,17 +1,75 @@
 """
-Tests for connectors (with mocked network).
+Tests for connectors (with mocked network or a local server).
 """
 
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+import asyncio
+import contextlib
 import json
+import tracemalloc
+
+import aiohttp
+from aiohttp import web
 
 from news_scanner.connectors import GdeltConnector, RSSConnector
+from news_scanner.connectors import rss as rss_module
+from news_scanner.utils import config
+from news_scanner.utils.config import GDELT_QUERIES
+
+
+class _FakeResponse:
+    """Canned aiohttp response, usable as the `async with session.get(...)` target."""
+
+    def __init__(self, status=200, body=b"", content_type="application/json"):
+        self.status = status
+        self.headers = {"content-type": content_type}
+        self.charset = content_type.partition("charset=")[2] or None
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture
+def mock_aiohttp_session(monkeypatch):
+    """
+    Builder for a mocked session whose get() yields one canned response.
+
+    Pass the session to a connector's constructor. aiohttp.ClientSession is
+    patched as well, so nothing can open a real one.
+    """
+    session_cls = aiohttp.ClientSession
+    monkeypatch.setattr(aiohttp, "ClientSession", MagicMock(spec=session_cls))
+
+    def make(status=200, json=None, text=None):
+        if json is not None:
+            response = _FakeResponse(status, _json_bytes(json))
+        else:
+            body = text.encode() if text is not None else b""
+            response = _FakeResponse(status, body, "application/xml")
+
+        session = MagicMock(spec=session_cls)
+        session.closed = False
+        session.get.return_value = response
+        return session
+
+    return make
+
+
+def _json_bytes(obj) -> bytes:
+    return json.dumps(obj).encode()
 
 
 class TestGdeltConnector:
-    @pytest.mark.asyncio
-    async def test_fetch_category(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_category(self, mock_aiohttp_session):
         """Test GDELT category fetch with mocked response."""
         mock_response = {
             "articles": [
@@ -31,75 +89,83 @@ class TestGdeltConnector:
             ]
         }
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.headers = {"content-type": "application/json"}
-            mock_resp.json = AsyncMock(return_value=mock_response)
+        mock_session = mock_aiohttp_session(json=mock_response)
 
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
+        connector = GdeltConnector(session=mock_session)
+        items = await connector.fetch_category("finance")
 
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
+        assert len(items) == 2
+        assert items[0].title == "Test Finance Article"
+        assert items[0].source == "example.com"
+        assert items[0].metadata.category == "finance"
 
-            connector = GdeltConnector()
-            items = await connector.fetch_category("finance")
-
-            assert len(items) == 2
-            assert items[0].title == "Test Finance Article"
-            assert items[0].source == "example.com"
-            assert items[0].metadata.category == "finance"
-
-    @pytest.mark.asyncio
-    async def test_fetch_category_empty_response(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_category_empty_response(self, mock_aiohttp_session):
         """Test handling of empty GDELT response."""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.headers = {"content-type": "application/json"}
-            mock_resp.json = AsyncMock(return_value={})
-
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
+        mock_session = mock_aiohttp_session(json={})
 
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
+        connector = GdeltConnector(session=mock_session)
+        items = await connector.fetch_category("politics")
 
-            connector = GdeltConnector()
-            items = await connector.fetch_category("politics")
+        assert len(items) == 0
 
-            assert len(items) == 0
-
-    @pytest.mark.asyncio
-    async def test_fetch_category_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_category_error(self, mock_aiohttp_session):
         """Test handling of HTTP error."""
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 500
-
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
-
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
-
-            connector = GdeltConnector()
-            items = await connector.fetch_category("tech")
-
-            assert len(items) == 0
+        mock_session = mock_aiohttp_session(status=500)
+
+        connector = GdeltConnector(session=mock_session)
+        items = await connector.fetch_category("tech")
+
+        assert len(items) == 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_session_reuse(self):
+        """Test that fetches share one session, closed only if owned."""
+        with patch("aiohttp.ClientSession") as mock_session_cls:
+            mock_session_cls.return_value.closed = False
+            mock_session_cls.return_value.close = AsyncMock()
+
+            async with GdeltConnector() as connector:
+                assert connector._get_session() is connector._get_session()
+            assert mock_session_cls.call_count == 1
+            mock_session_cls.return_value.close.assert_awaited_once()
+
+        injected = MagicMock()
+        injected.close = AsyncMock()
+        async with GdeltConnector(session=injected) as connector:
+            assert connector._get_session() is injected
+        injected.close.assert_not_awaited()
+
+    def test_unknown_transport(self):
+        """Test that an unsupported transport name is rejected."""
+        with pytest.raises(ValueError):
+            GdeltConnector(transport="urllib")
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_categories_concurrently(self, mock_aiohttp_session):
+        """Test that fetch() runs categories concurrently, up to max_concurrent."""
+        in_flight = peak = 0
+
+        class SlowResponse(_FakeResponse):
+            async def __aenter__(self):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.05)
+                in_flight -= 1
+                return self
+
+        mock_session = mock_aiohttp_session()
+        mock_session.get.side_effect = lambda *args, **kwargs: SlowResponse(
+            body=_json_bytes({"articles": []})
+        )
+
+        connector = GdeltConnector(session=mock_session)
+        await connector.fetch(categories=list(GDELT_QUERIES))
+
+        assert mock_session.get.call_count == len(GDELT_QUERIES)
+        assert peak == min(config.max_concurrent, len(GDELT_QUERIES))
 
 
 class TestRSSConnector:
@@ -125,83 +191,294 @@ class TestRSSConnector:
     </rss>
     """
 
-    @pytest.mark.asyncio
-    async def test_fetch_feed(self):
+    SAMPLE_ATOM = """<?xml version="1.0" encoding="utf-8"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+        <title>Test Feed</title>
+        <entry>
+            <title>Ceasefire talks resume</title>
+            <link rel="alternate" href="https://example.com/atom/1"/>
+            <summary>Talks &amp; more talks.</summary>
+            <updated>2024-01-15T12:00:00Z</updated>
+            <author><name>Jane Roe</name></author>
+        </entry>
+    </feed>
+    """
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_parse_rss(self, monkeypatch, use_lxml):
+        if not use_lxml:
+            monkeypatch.setattr(rss_module, "etree", None)
+        connector = RSSConnector()
+
+        items = connector._parse_rss(self.SAMPLE_RSS)
+        assert [item["title"] for item in items] == [
+            "Breaking News: Market Rally",
+            "Tech Company $AAPL Announces Layoffs",
+        ]
+        assert items[0]["link"] == "https://example.com/news/1"
+        assert items[0]["author"] == "John Doe"
+
+        items = connector._parse_rss(self.SAMPLE_ATOM)
+        assert items == [{
+            "title": "Ceasefire talks resume",
+            "link": "https://example.com/atom/1",
+            "description": "Talks & more talks.",
+            "pubDate": "2024-01-15T12:00:00Z",
+            "author": "Jane Roe",
+        }]
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_parse_rss_sloppy_feeds(self, monkeypatch, use_lxml):
+        """Test CDATA, HTML entities and truncated feeds on both parsers."""
+        if not use_lxml:
+            monkeypatch.setattr(rss_module, "etree", None)
+        connector = RSSConnector()
+
+        cdata = (
+            b"<rss><channel><item><title>T</title>"
+            b"<link><![CDATA[https://example.com/?a=1&b=2]]></link>"
+            b"<description><![CDATA[Tom &amp; Jerry]]></description>"
+            b"</item></channel></rss>"
+        )
+        assert connector._parse_rss(cdata) == [{
+            "title": "T",
+            "link": "https://example.com/?a=1&b=2",
+            "description": "Tom & Jerry",
+        }]
+
+        entities = (
+            b"<rss><channel><item><title>Hello&nbsp;world&mdash;AT&T</title>"
+            b"<link>https://example.com/1?a=1&b=2</link></item></channel></rss>"
+        )
+        assert connector._parse_rss(entities) == [{
+            "title": "Hello world—AT&T",
+            "link": "https://example.com/1?a=1&b=2",
+        }]
+
+        truncated = (
+            b"<rss><channel><item><title>One</title><link>https://example.com/1</link>"
+            b"</item><item><title>Two</title><link>https://example.com/2"
+        )
+        assert connector._parse_rss(truncated) == [
+            {"title": "One", "link": "https://example.com/1"},
+        ]
+
+    def test_parse_rss_parsers_agree(self):
+        """Test that the lxml and regex parsers read escaped HTML the same way."""
+        if rss_module.etree is None:
+            pytest.skip("lxml not installed")
+        connector = RSSConnector()
+
+        rss = (
+            b"<rss><channel><item><title>Tom &amp; Jerry &#8217;s</title>"
+            b"<link>https://example.com/1?a=1&amp;b=2</link>"
+            b"<description>&lt;p&gt;Hello &amp;amp; bye&lt;/p&gt;</description>"
+            b"<pubDate>Mon, 15 Jan 2024 12:00:00 +0000</pubDate>"
+            b"</item><item><title><![CDATA[A &amp; B]]></title>"
+            b"<link>https://example.com/2</link>"
+            b"<description><![CDATA[<p>Hi &amp; bye</p>]]></description>"
+            b"</item></channel></rss>"
+        )
+        atom = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+            b'<title type="html">Q&amp;A &lt;b&gt;live&lt;/b&gt;</title>'
+            b'<link href="https://example.com/3?x=1&amp;y=2"/>'
+            b'<summary type="html">&lt;p&gt;Hello &amp;amp; bye&lt;/p&gt;</summary>'
+            b'<author><name>Jane</name></author>'
+            b'</entry></feed>'
+        )
+
+        for feed in (rss, atom):
+            assert connector._parse_rss_lxml(feed) == connector._parse_rss_regex(feed)
+        assert connector._parse_rss_regex(rss)[0]["description"] == "Hello & bye"
+
+    def test_parse_rss_lxml_reports_recovered_errors(self):
+        """Test that lxml's silent recovery hands malformed feeds to the regex parser."""
+        if rss_module.etree is None:
+            pytest.skip("lxml not installed")
+        connector = RSSConnector()
+
+        with pytest.raises(ValueError):
+            connector._parse_rss_lxml(b"<rss><channel><item><title>One</title>")
+        # Entities are mapped before parsing, so valid-looking feeds stay on lxml
+        assert connector._parse_rss_lxml(
+            b"<rss><channel><item><title>A&nbsp;B</title></item></channel></rss>"
+        ) == [{"title": "A B", "link": None}]
+
+    def test_parse_rss_large(self):
+        """Test that the lxml parser streams items instead of building a tree."""
+        if rss_module.etree is None:
+            pytest.skip("lxml not installed")
+
+        items = "".join(
+            f"<item><title>Story {i}</title><link>https://example.com/news/{i}</link>"
+            f"<description>Markets moved today ({i}).</description></item>"
+            for i in range(10_000)
+        )
+        xml = f"<rss><channel><title>Big Feed</title>{items}</channel></rss>".encode()
+        connector = RSSConnector()
+
+        tracemalloc.start()
+        try:
+            parsed = connector._parse_rss(xml)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(parsed) == 10_000
+        assert parsed[-1]["title"] == "Story 9999"
+        # Working memory beyond the returned items stays far below the
+        # 1.3 MB document
+        assert peak - retained < 256 * 1024
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_feed(self, mock_aiohttp_session):
         """Test RSS feed fetch with mocked response."""
         from news_scanner.models import FeedSource
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.text = AsyncMock(return_value=self.SAMPLE_RSS)
+        mock_session = mock_aiohttp_session(text=self.SAMPLE_RSS)
+
+        connector = RSSConnector(use_proxy=False, session=mock_session)
+        source = FeedSource("Test Feed", "https://example.com/feed.xml", "finance")
+        items = await connector.fetch_feed(source)
 
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
+        assert len(items) == 2
+        assert items[0].title == "Breaking News: Market Rally"
+        assert items[0].source == "Test Feed"
+        assert items[0].summary == "Markets are up today."
 
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_feed_http_charset(self, mock_aiohttp_session):
+        """Test that the Content-Type charset decodes feeds without an encoding declaration."""
+        from news_scanner.models import FeedSource
+
+        mock_session = mock_aiohttp_session()
+        body = (
+            "<rss><channel><item><title>Café “news”</title>"
+            "<link>https://example.com/1</link></item></channel></rss>"
+        ).encode("windows-1252")
+        mock_session.get.return_value = _FakeResponse(
+            200, body, "application/rss+xml; charset=windows-1252"
+        )
 
-            connector = RSSConnector(use_proxy=False)
-            source = FeedSource("Test Feed", "https://example.com/feed.xml", "finance")
-            items = await connector.fetch_feed(source)
+        connector = RSSConnector(use_proxy=False, session=mock_session)
+        source = FeedSource("Test Feed", "https://example.com/feed.xml", "finance")
+        items = await connector.fetch_feed(source)
 
-            assert len(items) == 2
-            assert items[0].title == "Breaking News: Market Rally"
-            assert items[0].source == "Test Feed"
-            assert items[0].summary == "Markets are up today."
+        assert [item.title for item in items] == ["Café “news”"]
 
-    @pytest.mark.asyncio
-    async def test_ticker_extraction(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ticker_extraction(self, mock_aiohttp_session):
         """Test that tickers are extracted from RSS items."""
         from news_scanner.models import FeedSource
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 200
-            mock_resp.text = AsyncMock(return_value=self.SAMPLE_RSS)
-
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
+        mock_session = mock_aiohttp_session(text=self.SAMPLE_RSS)
 
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
+        connector = RSSConnector(use_proxy=False, session=mock_session)
+        source = FeedSource("Test Feed", "https://example.com/feed.xml", "tech")
+        items = await connector.fetch_feed(source)
 
-            connector = RSSConnector(use_proxy=False)
-            source = FeedSource("Test Feed", "https://example.com/feed.xml", "tech")
-            items = await connector.fetch_feed(source)
+        # Second item mentions $AAPL
+        assert "AAPL" in items[1].tickers
 
-            # Second item mentions $AAPL
-            assert "AAPL" in items[1].tickers
-
-    @pytest.mark.asyncio
-    async def test_fetch_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_error(self, mock_aiohttp_session):
         """Test handling of fetch error."""
         from news_scanner.models import FeedSource
 
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_resp = AsyncMock()
-            mock_resp.status = 404
+        mock_session = mock_aiohttp_session(status=404)
+
+        connector = RSSConnector(use_proxy=False, session=mock_session)
+        source = FeedSource("Test Feed", "https://example.com/feed.xml", "finance")
+        items = await connector.fetch_feed(source)
+
+        assert len(items) == 0
 
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__.return_value = mock_resp
-            mock_ctx.__aexit__.return_value = None
 
-            mock_session_inst = AsyncMock()
-            mock_session_inst.get.return_value = mock_ctx
-            mock_session_inst.__aenter__.return_value = mock_session_inst
-            mock_session_inst.__aexit__.return_value = None
-            mock_session.return_value = mock_session_inst
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, {"limit": 256, "limit_per_host": 8}),
+    ({"connector_limit": 10, "limit_per_host": 3}, {"limit": 10, "limit_per_host": 3}),
+])
+def test_connector_limits(monkeypatch, kwargs, expected):
+    """Test that default and custom pool limits reach the session's TCPConnector."""
+    captured = {}
 
-            connector = RSSConnector(use_proxy=False)
-            source = FeedSource("Test Feed", "https://example.com/feed.xml", "finance")
-            items = await connector.fetch_feed(source)
+    def tcp_connector(**kwargs):
+        captured.update(kwargs)
+        return MagicMock()
+
+    monkeypatch.setattr("aiohttp.TCPConnector", tcp_connector)
+    monkeypatch.setattr("aiohttp.ClientSession", MagicMock())
+
+    RSSConnector(**kwargs)._get_session()
+
+    assert captured == {**expected, "ttl_dns_cache": 300}
+
+
+@contextlib.asynccontextmanager
+async def _serve(routes: dict):
+    """Serve {path: (content_type, body)} on a local port; yields the base URL."""
+    app = web.Application()
+    for path, (content_type, body) in routes.items():
+        async def handler(request, content_type=content_type, body=body):
+            return web.Response(body=body, content_type=content_type)
+        app.router.add_get(path, handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
+
+
+class TestHttpxTransport:
+    @pytest.fixture(autouse=True)
+    def _require_httpx(self):
+        pytest.importorskip("httpx")
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_category(self):
+        """Test a GDELT fetch over real HTTP with transport="httpx"."""
+        body = _json_bytes({"articles": [
+            {"title": "Test Finance Article", "url": "https://example.com/article1",
+             "seendate": "20240115T120000Z", "domain": "example.com"},
+        ]})
+        async with _serve({"/api/v2/doc/doc": ("application/json", body)}) as base_url:
+            async with GdeltConnector(base_url=base_url, transport="httpx") as connector:
+                items = await connector.fetch_category("finance")
+
+        assert [item.title for item in items] == ["Test Finance Article"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_feed(self):
+        """Test RSS fetches over both transports give the same items."""
+        from news_scanner.models import FeedSource
 
-            assert len(items) == 0
+        routes = {"/feed.xml": (
+            "application/rss+xml", TestRSSConnector.SAMPLE_RSS.strip().encode()
+        )}
+        results = {}
+        async with _serve(routes) as base_url:
+            source = FeedSource("Test Feed", f"{base_url}/feed.xml", "finance")
+            missing = FeedSource("Missing", f"{base_url}/missing.xml", "finance")
+            for transport in ("aiohttp", "httpx"):
+                async with RSSConnector(use_proxy=False, transport=transport) as connector:
+                    items = await connector.fetch_feed(source)
+                    assert await connector.fetch_feed(missing) == []
+                results[transport] = [(item.title, item.url) for item in items]
+
+        assert len(results["httpx"]) == 2
+        assert results["httpx"] == results["aiohttp"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_connection_error(self):
+        """Test that httpx connection errors surface as handled aiohttp errors."""
+        async with _serve({}) as base_url:
+            pass  # Server stopped: the port now refuses connections
+
+        async with GdeltConnector(base_url=base_url, transport="httpx") as connector:
+            assert await connector.fetch_category("finance") == []
@@ -0,0 +1,45 @@
+"""
+Tests for data models.
+"""
+
+import json
+import sys
+
+import pytest
+from news_scanner import models as models_module
+from news_scanner.models import NormalizedNewsItem, NewsMetadata, FeedSource, IntelSource
+
+
+def _item() -> NormalizedNewsItem:
+    return NormalizedNewsItem(
+        id="1",
+        source="Le Monde",
+        url="https://example.com/1",
+        title="Café prices — up 5%",
+        published_at="2024-01-15T10:00:00Z",
+        fetched_at="2024-01-15T10:00:00Z",
+        tickers=["AAPL"],
+        metadata=NewsMetadata(category="finance"),
+    )
+
+
+class TestNormalizedNewsItem:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_json(self, monkeypatch, use_orjson):
+        """Test that both JSON encoders produce the same compact output."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(models_module, "orjson", None)
+
+        item = _item()
+        expected = json.dumps(item.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        assert item.to_json() == expected
+        assert NormalizedNewsItem.from_dict(json.loads(item.to_json())) == item
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_feedsource_slots():
+    """Test that feed sources are slotted (no per-instance __dict__)."""
+    assert not hasattr(FeedSource("Test Feed", "https://example.com/feed.xml"), "__dict__")
+    assert not hasattr(IntelSource("Test Intel", "https://example.com/intel.xml"), "__dict__")
@@ -0,0 +1,21 @@
+"""
+Tests for parsers.
+"""
+
+from news_scanner.parsers import TextParser
+
+
+class TestTextParser:
+    def test_extract_quotes(self):
+        parser = TextParser()
+        assert parser.extract_quotes('He said "rates will rise" and «c\'est fini»') == [
+            "rates will rise", "c'est fini",
+        ]
+
+    def test_extract_quotes_apostrophes(self):
+        """Test that apostrophes around a quote don't swallow it."""
+        parser = TextParser()
+        quotes = parser.extract_quotes(
+            'The CEO\'s remark: "growth is back" and the board\'s view'
+        )
+        assert quotes[0] == "growth is back"
@@ -0,0 +1,71 @@
+"""
+Tests for pipeline filters.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from news_scanner.pipeline.filters import FilterConfig, FilterPipeline, filter_items
+from news_scanner.models import NormalizedNewsItem, NewsMetadata
+
+
+def _item(id: str, title: str, hours_old: int = 0, **kwargs) -> NormalizedNewsItem:
+    published = datetime.utcnow() - timedelta(hours=hours_old)
+    metadata = NewsMetadata(
+        category=kwargs.pop("category", "finance"),
+        region=kwargs.pop("region", None),
+        is_alert=kwargs.pop("is_alert", False),
+    )
+    return NormalizedNewsItem(
+        id=id,
+        source=kwargs.pop("source", "Reuters"),
+        url=f"https://example.com/{id}",
+        title=title,
+        published_at=published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        fetched_at=published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        metadata=metadata,
+        **kwargs,
+    )
+
+
+ITEMS = [
+    _item("1", "Bitcoin rallies", topics=["CRYPTO"], tickers=["BTC"]),
+    _item("2", "Fed holds rates", hours_old=48, topics=["FINANCE"]),
+    _item("3", "Chip stocks slide", category="tech", source="BBC", tickers=["NVDA"]),
+    _item("4", "Bitcoin spam offer", is_alert=True, region="EUROPE"),
+    _item("5", "Ethereum upgrade ships", category="tech", topics=["CRYPTO"], is_alert=True),
+]
+
+
+class TestFilterItems:
+    @pytest.mark.parametrize("config, expected", [
+        (FilterConfig(), ["1", "2", "3", "4", "5"]),
+        (FilterConfig(categories=["tech"]), ["3", "5"]),
+        (FilterConfig(regions=["EUROPE"]), ["4"]),
+        (FilterConfig(topics=["CRYPTO"]), ["1", "5"]),
+        (FilterConfig(tickers=["NVDA", "BTC"]), ["1", "3"]),
+        (FilterConfig(sources=["BBC"]), ["3"]),
+        (FilterConfig(exclude_sources=["BBC"]), ["1", "2", "4", "5"]),
+        (FilterConfig(alerts_only=True), ["4", "5"]),
+        (FilterConfig(max_age_hours=24), ["1", "3", "4", "5"]),
+        (FilterConfig(include_keywords=["BITCOIN", "ethereum"]), ["1", "4", "5"]),
+        (FilterConfig(include_keywords=["bitcoin"], exclude_keywords=["spam"]), ["1"]),
+        (FilterConfig(categories=["finance"], topics=["CRYPTO"], max_age_hours=24), ["1"]),
+    ])
+    def test_filter_items(self, config, expected):
+        assert [item.id for item in filter_items(ITEMS, config)] == expected
+
+    def test_config_changes_rebuild_plan(self):
+        config = FilterConfig(categories=["tech"])
+        assert [item.id for item in filter_items(ITEMS, config)] == ["3", "5"]
+
+        config.categories = ["finance"]
+        config.alerts_only = True
+        assert [item.id for item in filter_items(ITEMS, config)] == ["4"]
+
+    def test_add_config_filter(self):
+        config = FilterConfig(topics=["CRYPTO"], exclude_keywords=["ethereum"])
+        pipeline = FilterPipeline().add_config_filter(config)
+
+        assert pipeline.apply(ITEMS) == filter_items(ITEMS, config)
+        assert [item.id for item in pipeline.apply(ITEMS)] == ["1"]
@@ -0,0 +1,98 @@
+"""
+Tests for storage adapters.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+from news_scanner.storage import SqliteStorage
+from news_scanner.storage.sqlite import CREATE_TABLE_SQL, INSERT_SQL, _item_row
+from news_scanner.models import NormalizedNewsItem
+
+
+def _item(id: str, url: str, content_text: str = "") -> NormalizedNewsItem:
+    return NormalizedNewsItem(
+        id=id,
+        source="Test",
+        url=url,
+        title=f"Title {id}",
+        published_at="2024-01-15T10:00:00Z",
+        fetched_at="2024-01-15T10:00:00Z",
+        content_text=content_text,
+    )
+
+
+class TestSqliteStorage:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_save_skips_duplicates(self, tmp_path):
+        """Test that repeated IDs and URLs are skipped."""
+        storage = SqliteStorage(str(tmp_path / "news.db"))
+        await storage.save([_item("1", "https://example.com/a")])
+        await storage.save([
+            _item("1", "https://example.com/b"),
+            _item("2", "https://example.com/a"),
+            _item("3", "https://example.com/c"),
+        ])
+
+        assert sorted(item.id for item in await storage.load()) == ["1", "3"]
+        storage.close()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_keep_longest(self, tmp_path):
+        """Test that a repeated URL keeps the longest content_text."""
+        storage = SqliteStorage(str(tmp_path / "news.db"), keep_longest=True)
+        await storage.save([_item("1", "https://example.com/a", "short")])
+        await storage.save([_item("2", "https://example.com/a", "much longer text")])
+        await storage.save([_item("3", "https://example.com/a", "tiny")])
+
+        items = await storage.load()
+        assert [(item.id, item.content_text) for item in items] == [
+            ("1", "much longer text"),
+        ]
+        storage.close()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_keep_longest_legacy_duplicate_urls(self, tmp_path):
+        """Test that a table with duplicate URLs (no idx_url) still accepts saves."""
+        db_path = str(tmp_path / "news.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(CREATE_TABLE_SQL)
+        conn.executemany(INSERT_SQL, [
+            _item_row(_item("1", "https://example.com/a")),
+            _item_row(_item("2", "https://example.com/a")),
+        ])
+        conn.commit()
+        conn.close()
+
+        storage = SqliteStorage(db_path, keep_longest=True)
+        await storage.save([
+            _item("2", "https://example.com/b"),
+            _item("3", "https://example.com/c", "text"),
+        ])
+
+        assert sorted(item.id for item in await storage.load()) == ["1", "2", "3"]
+        storage.close()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_reads_alongside_saves(self, tmp_path):
+        """Test that readers share the connection safely with concurrent saves."""
+        storage = SqliteStorage(str(tmp_path / "news.db"))
+        await storage.save([_item(str(i), f"https://example.com/{i}") for i in range(600)])
+
+        # A paused reader must not hold the connection lock
+        rows = storage.iter_load()
+        next(rows)
+        batches = [
+            [_item(f"{n}-{i}", f"https://example.com/{n}/{i}") for i in range(50)]
+            for n in range(4)
+        ]
+        await asyncio.gather(
+            *(storage.save(batch) for batch in batches),
+            *(asyncio.to_thread(storage.count) for _ in range(4)),
+            *(asyncio.to_thread(storage.get_sources) for _ in range(4)),
+        )
+
+        assert storage.count() == 800
+        assert len(list(rows)) >= 599
+        storage.close()
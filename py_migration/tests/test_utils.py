@@ -0,0 +1,47 @@
+"""
+Tests for utility helpers.
+"""
+
+import pytest
+from news_scanner.utils import Config, generate_id, json_dumps_bytes, parse_gdelt_date
+from news_scanner.utils import helpers as helpers_module
+
+
+class TestHelpers:
+    def test_generate_id_stable(self):
+        """Test that IDs keep their MD5-based values, so stored items still match."""
+        assert generate_id("https://example.com/a", "BBC World") == "34b59f77f8e3-cd69b81ea00c"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_dumps_bytes(self, monkeypatch, use_orjson):
+        """Test that both JSON encoders write the same compact UTF-8 bytes."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(helpers_module, "orjson", None)
+
+        data = {"title": "Café — up", "tickers": ["AAPL", "BTC"], "n": 1}
+        assert json_dumps_bytes(data) == (
+            '{"title":"Café — up","tickers":["AAPL","BTC"],"n":1}'.encode("utf-8")
+        )
+
+    def test_parse_gdelt_date(self):
+        """Test GDELT seendates, repeated ones, and the ISO fallback."""
+        for _ in range(2):
+            assert parse_gdelt_date("20240115T120000Z") == "2024-01-15T12:00:00Z"
+        assert parse_gdelt_date("2024-01-15T12:00:00Z") == "2024-01-15T12:00:00Z"
+        assert parse_gdelt_date("2024-01-15T12:00:00+02:00") == "2024-01-15T12:00:00+02:00"
+
+
+class TestConfig:
+    def test_max_concurrent_must_be_positive(self, monkeypatch):
+        """Test that a zero request limit is rejected instead of hanging fetches."""
+        with pytest.raises(ValueError):
+            Config(max_concurrent=0)
+
+        monkeypatch.setenv("MAX_CONCURRENT", "0")
+        with pytest.raises(ValueError):
+            Config.from_env()
+
+        monkeypatch.setenv("MAX_CONCURRENT", "2")
+        assert Config.from_env().max_concurrent == 2